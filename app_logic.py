@@ -17,6 +17,7 @@ import concurrent.futures
 #import torchaudio # For audio file handling
 import logging # For logging
 import gc
+import sys
 import psutil
 # ebooklib may not be present in lightweight test environments; provide a minimal fallback
 try:
@@ -41,6 +42,10 @@ except Exception:
     _FasterWhisperModel = None  # type: ignore
     FASTER_WHISPER_AVAILABLE = False
 
+# GIL switch interval (seconds) while a TTS engine loads, so the Tk thread gets the GIL back
+# quickly between the loader's import/unpickle steps. Python's default is 0.005.
+TTS_INIT_SWITCH_INTERVAL = 0.001
+
 class AppLogic:
     def __init__(self, ui_app, state, selected_tts_engine_name: str):
         self.ui = ui_app
@@ -517,7 +522,14 @@ class AppLogic:
                 self.ui.update_queue.put({'error': f"Unknown TTS engine: {current_engine_to_init}"})
                 return
 
-            if self.current_tts_engine_instance.initialize():
+            previous_switch_interval = sys.getswitchinterval()
+            sys.setswitchinterval(min(previous_switch_interval, TTS_INIT_SWITCH_INTERVAL))
+            try:
+                initialized = self.current_tts_engine_instance.initialize()
+            finally:
+                sys.setswitchinterval(previous_switch_interval)
+
+            if initialized:
                 self.ui.update_queue.put({'tts_init_complete': True})
                 self.logger.info("TTS engine initialization complete.")
             else:
@@ -526,7 +538,7 @@ class AppLogic:
             self.logger.error(f"Exception during TTS initialization: {traceback.format_exc()}")
             self.ui.update_queue.put({'error': f"An unexpected error occurred during TTS initialization: {e}"})
 
-    def _submit_tts_task(self, item, clips_dir):
+    def _submit_tts_task(self, item, clips_dir, defer_write=True):
         """Prepares and executes a single TTS task, returning the result."""
         if self.state.stop_requested:
             return None # Don't process if a stop has been requested
@@ -551,6 +563,9 @@ class AppLogic:
                 elif isinstance(self.current_tts_engine_instance, ChatterboxTTS):
                     engine_tts_kwargs['internal_speaker_name'] = 'chatterbox_default_internal'
 
+        # Batch generation reads the clips only after the run finishes, so writes can overlap synthesis.
+        engine_tts_kwargs['defer_write'] = defer_write
+
         output_path = self._safe_path_join(clips_dir, f"line_{item['original_index']:05d}_chunk_{item['chunk_index']:03d}.wav")
         text_for_tts = item['text']
 
@@ -571,6 +586,25 @@ class AppLogic:
             self.logger.error(f"TTS generation FAILED for output {output_path.name}. Error: {error_type}")
             return None # Indicate failure
 
+    def _retry_failed_clip_writes(self, failed_writes, clips_info, tasks_by_clip_path, clips_dir):
+        """Regenerate clips whose deferred write failed, writing synchronously this time.
+
+        Clips that still fail are dropped from the returned list so review never sees a missing file.
+        """
+        failed_paths = {str(Path(p).resolve()) for p in failed_writes}
+        retried_clips_info = []
+        for clip_info in clips_info:
+            if str(Path(clip_info['clip_path']).resolve()) not in failed_paths:
+                retried_clips_info.append(clip_info)
+                continue
+            self.logger.warning(f"Deferred write failed for {Path(clip_info['clip_path']).name}; regenerating it.")
+            result = self._submit_tts_task(tasks_by_clip_path[clip_info['clip_path']], clips_dir, defer_write=False)
+            if result:
+                retried_clips_info.append(result)
+            else:
+                self.logger.error(f"Dropping clip {Path(clip_info['clip_path']).name}: audio file could not be written.")
+        return retried_clips_info
+
     def run_audio_generation(self):
         """Generates audio for each line in analysis_result sequentially to reduce memory load."""
         generated_clips_info_list = []
@@ -592,22 +626,20 @@ class AppLogic:
             # --- 1. Prepare Task List ---
             tasks_to_process = []
             total_chunks = 0
+            # Loop-invariant: the engine does not change during a run
+            max_chunk_len = 400 if isinstance(self.current_tts_engine_instance, CoquiXTTS) else 800
+            sanitize_for_tts = self.ui.sanitize_for_tts
             for original_idx, item in enumerate(self.state.analysis_result):
                 line_text = item['line']
                 speaker_name = item['speaker']
 
-                if isinstance(self.current_tts_engine_instance, CoquiXTTS):
-                    max_chunk_len = 400
-                else:
-                    max_chunk_len = 800
-
                 quote_aware_segments = self._split_quote_aware_segments(line_text, speaker_name)
                 chunk_index_counter = 0
 
                 for segment_idx, segment in enumerate(quote_aware_segments):
                     segment_text = segment['text']
                     segment_speaker = segment['speaker']
-                    sanitized_segment = self.ui.sanitize_for_tts(segment_text)
+                    sanitized_segment = sanitize_for_tts(segment_text)
                     subline_type = self._classify_subline_type(quote_aware_segments, segment_idx)
 
                     if not sanitized_segment.strip():
@@ -659,31 +691,40 @@ class AppLogic:
             # --- 2. Sequential Audio Generation ---
             processed_task_counter = 0
             memory_check_interval = 50  # Check memory every 50 tasks
-            for task in tasks_to_process:
-                if self.state.stop_requested:
-                    self.logger.info("Audio generation stop requested. Halting processing.")
-                    break
+            tasks_by_clip_path = {}
+            try:
+                for task in tasks_to_process:
+                    if self.state.stop_requested:
+                        self.logger.info("Audio generation stop requested. Halting processing.")
+                        break
 
-                result = self._submit_tts_task(task, clips_dir)
+                    result = self._submit_tts_task(task, clips_dir)
                 
-                if result:
-                    generated_clips_info_list.append(result)
+                    if result:
+                        generated_clips_info_list.append(result)
+                        tasks_by_clip_path[result['clip_path']] = task
                 
-                processed_task_counter += 1
-                self.ui.update_queue.put({'progress': processed_task_counter, 'is_generation': True})
+                    processed_task_counter += 1
+                    self.ui.update_queue.put({'progress': processed_task_counter, 'is_generation': True})
                 
-                # Memory management
-                if processed_task_counter % memory_check_interval == 0:
-                    memory_percent = psutil.virtual_memory().percent
-                    if memory_percent > 85:
-                        self.logger.warning(f"High memory usage: {memory_percent}%. Running garbage collection.")
-                        gc.collect()
-                        if hasattr(self.current_tts_engine_instance, 'engine') and hasattr(self.current_tts_engine_instance.engine, 'cuda'):
-                            try:
-                                import torch
-                                torch.cuda.empty_cache()
-                            except:
-                                pass
+                    # Memory management
+                    if processed_task_counter % memory_check_interval == 0:
+                        memory_percent = psutil.virtual_memory().percent
+                        if memory_percent > 85:
+                            self.logger.warning(f"High memory usage: {memory_percent}%. Running garbage collection.")
+                            gc.collect()
+                            if hasattr(self.current_tts_engine_instance, 'engine') and hasattr(self.current_tts_engine_instance.engine, 'cuda'):
+                                try:
+                                    import torch
+                                    torch.cuda.empty_cache()
+                                except:
+                                    pass
+            finally:
+                # Make sure every deferred clip write has landed on disk before anything reads them
+                failed_writes = self.current_tts_engine_instance.flush()
+
+            if failed_writes and not self.state.stop_requested:
+                generated_clips_info_list = self._retry_failed_clip_writes(failed_writes, generated_clips_info_list, tasks_by_clip_path, clips_dir)
 
             if self.state.stop_requested:
                 self.state.stop_requested = False # Reset flag
@@ -1026,7 +1067,7 @@ class AppLogic:
         if not filepath_str: return
         ebook_candidate_path = Path(filepath_str)
         if ebook_candidate_path.suffix.lower() not in self.ui.allowed_extensions:
-            self.ui.update_queue.put({'error': f"Invalid File Type: '{ebook_candidate_path.suffix}'. Supported: {', '.join(self.ui.allowed_extensions)}"})
+            self.ui.update_queue.put({'error': f"Invalid File Type: '{ebook_candidate_path.suffix}'. Supported: {', '.join(sorted(self.ui.allowed_extensions))}"})
             return
 
         # Selecting a single ebook explicitly exits folder batch mode.
@@ -1203,7 +1244,7 @@ class AppLogic:
 
         # Remove from the main voices list
         try:
-            self.state.voices.remove(voice_to_delete)
+            self.state.remove_voice(voice_to_delete)
         except ValueError:
             self.logger.warning(f"Voice '{voice_name}' not found in voices list for removal")
             return
@@ -1341,7 +1382,7 @@ class AppLogic:
             self.ui.update_queue.put({'status': "No new voices could be auto-assigned.", "level": "info"})
             self.logger.info("Auto-assignment: No new assignments made.")
         
-        self.ui.update_cast_list() # Refresh the UI to reflect the assignments
+        self.ui.update_cast_list(speakers_changed=False) # Refresh the UI to reflect the assignments
 
     def _normalize_profile_value(self, value):
         """Normalize profile values, converting 'N/A' to 'Unknown'"""
@@ -1,4 +1,8 @@
 # app_state.py
+from bisect import bisect_left, insort
+from collections import Counter
+from operator import itemgetter
+import sys
 from enum import Enum
 from pathlib import Path
 import threading # For active_thread type hint
@@ -14,6 +18,19 @@ class PostAction:
     SHUTDOWN = "Shutdown"
     QUIT = "Quit"
 
+def intern_speakers(rows: list[dict]) -> list[dict]:
+    """Intern each row's speaker label in place and return the rows.
+
+    A book repeats a handful of speaker names across thousands of lines; interning keeps one string
+    per name and lets the speaker comparisons and dict/set lookups short-circuit on identity.
+    """
+    intern = sys.intern
+    for row in rows:
+        speaker = row.get('speaker')
+        if type(speaker) is str:
+            row['speaker'] = intern(speaker)
+    return rows
+
 class AppState:
     """A dedicated class to hold the application's shared state."""
     def __init__(self):
@@ -45,14 +62,13 @@ class AppState:
 
         # --- Voice and Assignment State ---
         self.voicing_mode: VoicingMode = VoicingMode.CAST # Default to Cast
-        self.voices: list = []
+        self.voices: list = [] # Property; keeps the name index below in sync
         self.narrator_voice_info: dict | None = None
         self.speaker_voice_info: dict | None = None
         self.loaded_narrator_voice_name_from_config: str | None = None
         self.loaded_speaker_voice_name_from_config: str | None = None
         self.voice_assignments: dict = {}
         self.speaker_colors: dict = {}
-        self._color_palette_index: int = 0
 
         # --- Generation and Review State ---
         self.generated_clips_info: list[dict] = []
@@ -62,6 +78,50 @@ class AppState:
         self.last_operation: str | None = None
         self.stop_requested = False # Flag to request a thread to stop
 
+    @property
+    def voices(self) -> list:
+        return self._voices
+
+    @voices.setter
+    def voices(self, voices: list):
+        self._voices = voices
+        self._voices_by_name: dict[str, dict] = {}
+        for voice in voices:
+            self._voices_by_name.setdefault(voice['name'], voice)
+        self._sorted_voice_names: list[str] = sorted(v['name'] for v in voices)
+
+    @property
+    def sorted_voice_names(self) -> list[str]:
+        """Voice names in sorted order, maintained incrementally. Treat as read-only."""
+        return self._sorted_voice_names
+
+    def add_voice(self, voice: dict):
+        self._voices.append(voice)
+        self._voices_by_name.setdefault(voice['name'], voice)
+        insort(self._sorted_voice_names, voice['name'])
+
+    def remove_voice(self, voice: dict):
+        """Removes a voice from the list. Raises ValueError if it is not present."""
+        self._voices.remove(voice)
+        del self._sorted_voice_names[bisect_left(self._sorted_voice_names, voice['name'])]
+        if self._voices_by_name.get(voice['name']) is voice:
+            del self._voices_by_name[voice['name']]
+            # Fall back to another voice with the same name, if any
+            replacement = next((v for v in self._voices if v['name'] == voice['name']), None)
+            if replacement is not None:
+                self._voices_by_name[voice['name']] = replacement
+
+    def find_voice(self, name: str | None) -> dict | None:
+        return self._voices_by_name.get(name)
+
+    def speaker_line_counts(self) -> Counter:
+        """Lines per speaker, keyed in order of first appearance in analysis_result.
+
+        Pulls the speaker column out in one C-level pass, so callers needing the unique speakers,
+        their order and their counts don't each walk the row dicts.
+        """
+        return Counter(map(itemgetter('speaker'), self.analysis_result))
+
     def to_dict(self):
         return {
             "ebook_path": str(self.ebook_path) if self.ebook_path else None,
@@ -85,10 +145,10 @@ class AppState:
         self.txt_path = Path(data["txt_path"]).resolve() if data.get("txt_path") else None
         self.title = data.get("title", "")
         self.author = data.get("author", "")
-        self.analysis_result = data.get("analysis_result", [])
-        self.cast_list = data.get("cast_list", [])
+        self.analysis_result = intern_speakers(data.get("analysis_result", []))
+        self.cast_list = [sys.intern(name) for name in data.get("cast_list", [])]
         self.character_profiles = data.get("character_profiles", {})
-        self.voice_assignments = data.get("voice_assignments", {})
+        self.voice_assignments = {sys.intern(name): voice for name, voice in data.get("voice_assignments", {}).items()}
         self.loaded_narrator_voice_name_from_config = data.get("narrator_voice_name")
         self.loaded_speaker_voice_name_from_config = data.get("speaker_voice_name")
         self.voicing_mode = VoicingMode(data.get("voicing_mode", VoicingMode.CAST.value))
@@ -48,7 +48,7 @@ class BatchProcessor:
         invalid_files = []
         
         for path in file_paths:
-            if path.exists() and path.suffix.lower() in ['.epub', '.mobi', '.pdf', '.azw3']:
+            if path.exists() and path.suffix.lower() in {'.epub', '.mobi', '.pdf', '.azw3'}:
                 valid_files.append(path)
             else:
                 invalid_files.append(path)
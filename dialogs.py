@@ -1,4 +1,6 @@
 # dialogs.py
+import math
+import time
 import tkinter as tk
 from tkinter import simpledialog, messagebox, scrolledtext, ttk, filedialog
 from pathlib import Path
@@ -90,24 +92,36 @@ class ConfirmationDialog(tk.Toplevel):
 
         self.protocol("WM_DELETE_WINDOW", self._cancel) 
         self.geometry(f"+{parent.winfo_rootx()+int(parent.winfo_width()/2 - 200)}+{parent.winfo_rooty()+int(parent.winfo_height()/2 - 100)}") # Center on parent
+        # One timer fires the action at the deadline; the label tick only repaints, so late ticks can't delay it
+        self._deadline = time.monotonic() + countdown_seconds
+        self.timer_id = self.after(int(countdown_seconds * 1000), self._on_countdown_finished)
         self._update_countdown()
 
     def _update_countdown(self):
-        if self.countdown_remaining > 0:
-            self.countdown_label.config(text=f"Action in {self.countdown_remaining}s")
-            self.countdown_remaining -= 1
-            self.timer_id = self.after(1000, self._update_countdown)
-        else:
-            self.countdown_label.config(text="Proceeding...")
-            self._proceed()
+        time_left = self._deadline - time.monotonic()
+        remaining = math.ceil(time_left)
+        if remaining <= 0: return # _on_countdown_finished is due
+        if remaining != self.countdown_remaining:
+            self.countdown_remaining = remaining
+            self.countdown_label.config(text=f"Action in {remaining}s")
+        # Wake just after the displayed second runs out
+        self.tick_id = self.after(int((time_left - (remaining - 1)) * 1000) + 1, self._update_countdown)
+
+    def _on_countdown_finished(self):
+        self.countdown_label.config(text="Proceeding...")
+        self._proceed()
+
+    def _cancel_timers(self):
+        for timer_attr in ('timer_id', 'tick_id'):
+            if hasattr(self, timer_attr): self.after_cancel(getattr(self, timer_attr))
 
     def _proceed(self):
-        if hasattr(self, 'timer_id'): self.after_cancel(self.timer_id)
+        self._cancel_timers()
         self.destroy()
         self.action_callback(True)
 
     def _cancel(self):
-        if hasattr(self, 'timer_id'): self.after_cancel(self.timer_id)
+        self._cancel_timers()
         self.destroy()
         self.action_callback(False)
 
@@ -127,7 +141,7 @@ class VoiceSelectionDialog(simpledialog.Dialog):
         tk.Label(master, text=f"Select a voice for the {self.voice_type}:", bg=bg_color, fg=fg_color).pack(pady=10)
 
         # Dropdown for existing voices
-        voice_names = sorted([v['name'] for v in self.app_controller.state.voices])
+        voice_names = self.app_controller.state.sorted_voice_names
         self.voice_var = tk.StringVar(master)
         if voice_names:
             self.voice_var.set(voice_names[0])
@@ -828,6 +842,12 @@ class TrainingLogWindow(tk.Toplevel):
             # If `after` can't be used (window destroyed), ignore
             pass
 
+    def append_lines(self, lines: list):
+        """Thread-safe batched append: one text insert for many lines."""
+        if self.closed or not lines:
+            return
+        self.append_line("\n".join(lines))
+
     def update_progress(self, info: dict):
         """Thread-safe update of the progress bar / labels. `info` is a parsed trainer dict."""
         if self.closed:
@@ -936,13 +956,13 @@ class TrainingLogWindow(tk.Toplevel):
 
             if self.app_controller.add_voice_from_dialog_data(new_voice_data, filepath_str):
                 # Update dropdown values only if voice was successfully added
-                voice_names = sorted([v['name'] for v in self.app_controller.state.voices])
+                voice_names = self.app_controller.state.sorted_voice_names
                 self.voice_dropdown.config(values=voice_names)
                 self.voice_var.set(new_voice_data['name']) # Select the newly added voice
 
     def apply(self):
         selected_name = self.voice_var.get()
-        self.selected_voice = next((v for v in self.app_controller.state.voices if v['name'] == selected_name), None)
+        self.selected_voice = self.app_controller.state.find_voice(selected_name)
         if not self.selected_voice:
             messagebox.showwarning("No Voice Selected", "Please select a voice.", parent=self)
             return False
@@ -1,5 +1,5 @@
 # tests/test_coqui_parser.py
-from tts_engines import CoquiXTTS
+from tts_engines import CoquiXTTS, _parse_trainer_line
 
 SAMPLES = [
     ("Epoch: 1/5, Step: 10/100, loss: 0.1234, ETA: 00:20", {'epoch':1,'epoch_total':5,'step':10,'step_total':100,'loss':0.1234}),
@@ -24,6 +24,26 @@ def test_parser_samples():
                 assert parsed[k] == v, f"Value mismatch for key {k}: {parsed[k]} != {v}"
 
 
+def test_parse_trainer_line_skips_lines_without_metrics():
+    assert _parse_trainer_line(" > Training Environment:") is None
+    assert _parse_trainer_line("Traceback (most recent call last):") is None
+    assert _parse_trainer_line("Saved 3 files") is None
+
+
+def test_parse_trainer_line_derives_percent_from_step_then_epoch():
+    assert _parse_trainer_line("Step: 25/100")['percent'] == 25.0
+    assert _parse_trainer_line("Epoch: 2/8")['percent'] == 25.0
+
+
+def test_parse_trainer_line_memoized_result_matches_parser():
+    line = "Epoch: 1/5, Step: 10/100, loss: 0.1234, ETA: 00:20"
+    assert _parse_trainer_line(line) is _parse_trainer_line(line)
+    assert parser(line) == _parse_trainer_line(line)
+
+
 if __name__ == '__main__':
     test_parser_samples()
+    test_parse_trainer_line_skips_lines_without_metrics()
+    test_parse_trainer_line_derives_percent_from_step_then_epoch()
+    test_parse_trainer_line_memoized_result_matches_parser()
     print('All parser sample tests passed')
@@ -0,0 +1,112 @@
+import re
+import sys
+from pathlib import Path
+import types
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+pydub_mod = sys.modules.setdefault('pydub', types.SimpleNamespace())
+setattr(pydub_mod, 'AudioSegment', type('AudioSegment', (), {}))
+sys.modules.setdefault('pydub.playback', types.SimpleNamespace(play=lambda *a, **k: None))
+ebooklib_mod = sys.modules.setdefault('ebooklib', types.SimpleNamespace(ITEM_COVER='cover'))
+setattr(ebooklib_mod, 'epub', types.SimpleNamespace(read_epub=lambda p: None))
+sys.modules.setdefault('ebooklib.epub', types.SimpleNamespace(read_epub=lambda p: None))
+
+class _StubImage:
+    @staticmethod
+    def new(mode, size, color=None):
+        class _I:
+            def save(self, path):
+                return None
+        return _I()
+
+class _StubDraw:
+    def __init__(self, img):
+        pass
+    def text(self, *a, **k):
+        return None
+    def textbbox(self, *a, **k):
+        return (0, 0, 10, 10)
+
+class _StubFont:
+    @staticmethod
+    def truetype(*a, **k):
+        return _StubFont()
+    @staticmethod
+    def load_default():
+        return _StubFont()
+    def getlength(self, s):
+        return len(s) * 6
+
+sys.modules.setdefault('PIL', types.SimpleNamespace(Image=_StubImage, ImageDraw=_StubDraw, ImageFont=_StubFont))
+sys.modules.setdefault('PIL.Image', _StubImage)
+sys.modules.setdefault('PIL.ImageDraw', _StubDraw)
+sys.modules.setdefault('PIL.ImageFont', _StubFont)
+
+class _StubTTSEngine:
+    def __init__(self, *a, **k):
+        pass
+    def get_engine_name(self):
+        return 'stub'
+    def is_trainer_available(self):
+        return False
+    def get_engine_specific_voices(self):
+        return []
+
+sys.modules.setdefault('tts_engines', types.SimpleNamespace(TTSEngine=_StubTTSEngine, CoquiXTTS=_StubTTSEngine, ChatterboxTTS=_StubTTSEngine))
+sys.modules.setdefault('file_operations', types.SimpleNamespace(FileOperator=type('FileOperator', (), {'__init__': lambda self, state, q, logger: None})))
+_added_text_processing_stub = False
+if 'text_processing' not in sys.modules:
+    sys.modules['text_processing'] = types.SimpleNamespace(TextProcessor=type('TextProcessor', (), {'__init__': lambda self, state, q, logger, sel=None: None}))
+    _added_text_processing_stub = True
+
+from ui_setup import RadioShowApp, _RE_TTS_BRACKETS, _RE_TTS_PARENS, _RE_TTS_ELLIPSIS, _RE_TTS_DOUBLE_DASH, _RE_TTS_WHITESPACE
+
+if _added_text_processing_stub:
+    del sys.modules['text_processing']
+
+
+# The implementation before the single-pass str.translate change, kept here as the reference.
+_OLD_RE_TTS_QUOTES = re.compile(r'[“”‘’"\\]')
+
+
+def _old_sanitize_core(text):
+    text = _RE_TTS_BRACKETS.sub('', text)
+    text = _RE_TTS_PARENS.sub('', text)
+    text = text.replace('*', ''); text = _RE_TTS_WHITESPACE.sub(' ', text)
+    text = _OLD_RE_TTS_QUOTES.sub('', text)
+    text = _RE_TTS_ELLIPSIS.sub(', ', text)
+    text = _RE_TTS_DOUBLE_DASH.sub(', ', text)
+    text = text.replace('—', ', ').replace('–', ', ')
+    return _RE_TTS_WHITESPACE.sub(' ', text).strip()
+
+
+SAMPLES = [
+    'Plain narration with nothing to strip.',
+    '“Hello,” she said, ‘quietly’.',
+    'He *really* meant it... or did he -- no.',
+    'A [laughter] line (whispering) with  extra   spaces.',
+    'Em—dash and en–dash and a back\\slash "quoted".',
+    '  *  “” ... --  ',
+    '',
+]
+
+
+def _sanitize(text, engine='Coqui XTTS'):
+    return RadioShowApp.sanitize_for_tts(types.SimpleNamespace(selected_tts_engine_name=engine), text)
+
+
+def test_sanitize_for_tts_matches_previous_implementation():
+    for text in SAMPLES:
+        assert _sanitize(text) == _old_sanitize_core(text), f"Output changed for: {text!r}"
+
+
+def test_sanitize_for_tts_strips_stage_directions_and_normalizes_pauses():
+    assert _sanitize('A [laughter] line (whispering) with  extra   spaces.') == 'A line with extra spaces.'
+    assert _sanitize('He meant it... or did he -- no.') == 'He meant it, or did he, no.'
+    assert _sanitize('Em—dash and en–dash') == 'Em, dash and en, dash'
+
+
+def test_sanitize_for_tts_title_cases_chatterbox_headers():
+    assert _sanitize('CHAPTER ONE', engine='Chatterbox') == 'Chapter One.'
+    assert _sanitize('CHAPTER ONE', engine='Coqui XTTS') == 'CHAPTER ONE'
@@ -0,0 +1,142 @@
+import sys
+import tkinter as tk
+from pathlib import Path
+import types
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+pydub_mod = sys.modules.setdefault('pydub', types.SimpleNamespace())
+setattr(pydub_mod, 'AudioSegment', type('AudioSegment', (), {}))
+sys.modules.setdefault('pydub.playback', types.SimpleNamespace(play=lambda *a, **k: None))
+ebooklib_mod = sys.modules.setdefault('ebooklib', types.SimpleNamespace(ITEM_COVER='cover'))
+setattr(ebooklib_mod, 'epub', types.SimpleNamespace(read_epub=lambda p: None))
+sys.modules.setdefault('ebooklib.epub', types.SimpleNamespace(read_epub=lambda p: None))
+
+class _StubImage:
+    @staticmethod
+    def new(mode, size, color=None):
+        class _I:
+            def save(self, path):
+                return None
+        return _I()
+
+class _StubDraw:
+    def __init__(self, img):
+        pass
+    def text(self, *a, **k):
+        return None
+    def textbbox(self, *a, **k):
+        return (0, 0, 10, 10)
+
+class _StubFont:
+    @staticmethod
+    def truetype(*a, **k):
+        return _StubFont()
+    @staticmethod
+    def load_default():
+        return _StubFont()
+    def getlength(self, s):
+        return len(s) * 6
+
+sys.modules.setdefault('PIL', types.SimpleNamespace(Image=_StubImage, ImageDraw=_StubDraw, ImageFont=_StubFont))
+sys.modules.setdefault('PIL.Image', _StubImage)
+sys.modules.setdefault('PIL.ImageDraw', _StubDraw)
+sys.modules.setdefault('PIL.ImageFont', _StubFont)
+
+class _StubTTSEngine:
+    def __init__(self, *a, **k):
+        pass
+    def get_engine_name(self):
+        return 'stub'
+    def is_trainer_available(self):
+        return False
+    def get_engine_specific_voices(self):
+        return []
+
+sys.modules.setdefault('tts_engines', types.SimpleNamespace(TTSEngine=_StubTTSEngine, CoquiXTTS=_StubTTSEngine, ChatterboxTTS=_StubTTSEngine))
+sys.modules.setdefault('file_operations', types.SimpleNamespace(FileOperator=type('FileOperator', (), {'__init__': lambda self, state, q, logger: None})))
+_added_text_processing_stub = False
+if 'text_processing' not in sys.modules:
+    sys.modules['text_processing'] = types.SimpleNamespace(TextProcessor=type('TextProcessor', (), {'__init__': lambda self, state, q, logger, sel=None: None}))
+    _added_text_processing_stub = True
+
+from ui_setup import RadioShowApp, UpdateQueue, UPDATE_QUEUE_BATCH_LIMIT, _coalesce_kind
+
+if _added_text_processing_stub:
+    del sys.modules['text_processing']
+
+
+def _make_app():
+    try:
+        root = tk.Tk()
+        root.withdraw()
+    except tk.TclError:
+        class _TmpRoot:
+            def destroy(self):
+                pass
+        root = _TmpRoot()
+    return root, RadioShowApp(root)
+
+
+def test_check_update_queue_handles_at_most_one_batch_per_tick():
+    root, app = _make_app()
+    handled = []
+    app._handle_status_update = handled.append
+
+    for i in range(UPDATE_QUEUE_BATCH_LIMIT + 5):
+        app.update_queue.put({'status': f'step {i}', 'level': 'info'})
+    app.check_update_queue()
+
+    # The rest waits for the next tick so input and redraws get a turn in between
+    assert len(app.update_queue) == 5
+
+    root.destroy()
+
+
+def test_coalesce_kind_only_matches_pure_repaints():
+    assert _coalesce_kind({'status': 'Working'}) == 'status'
+    assert _coalesce_kind({'progress': 3, 'is_generation': True}) == 'generation'
+    # Extra keys carry data that must be applied, so those messages are never skipped
+    assert _coalesce_kind({'status': 'Working', 'error': 'boom'}) is None
+    # A falsy marker (first ASR progress of 0) is routed elsewhere and must not be dropped
+    assert _coalesce_kind({'asr_validation_progress': 0, 'asr_validation_total': 5}) is None
+
+
+def test_check_update_queue_keeps_last_status_and_progress_per_kind():
+    root, app = _make_app()
+    statuses = []
+    progress = []
+    app._handle_status_update = statuses.append
+    app._handle_progress_update = lambda update, repaint=True: progress.append(update['progress'])
+
+    for i in range(1, 4):
+        app.update_queue.put({'status': f'step {i}'})
+        app.update_queue.put({'progress': i, 'is_generation': True})
+    app.check_update_queue()
+
+    assert statuses == ['step 3']
+    assert progress == [3]
+
+    root.destroy()
+
+
+def test_update_queue_is_fifo():
+    q = UpdateQueue()
+    for i in range(3):
+        q.put({'progress': i})
+    assert [q.popleft()['progress'] for _ in range(3)] == [0, 1, 2]
+    assert not q
+
+
+def test_update_queue_wakes_once_per_drain():
+    wakeups = []
+    q = UpdateQueue(wakeup=lambda: wakeups.append(1))
+    q.put({'status': 'a'})
+    q.put({'status': 'b'})
+    assert len(wakeups) == 1
+
+    q.begin_drain()
+    while q:
+        q.popleft()
+    q.put({'status': 'c'})
+    assert len(wakeups) == 2
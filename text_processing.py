@@ -5,7 +5,7 @@ import traceback
 import time
 import openai
 import logging
-from app_state import VoicingMode
+from app_state import VoicingMode, intern_speakers
 from transformers import AutoTokenizer # Import AutoTokenizer
 
 class TextProcessor:
@@ -764,6 +764,7 @@ class TextProcessor:
                                     results.append(line_data)
 
             self._propagate_dialogue_continuity(results)
+            intern_speakers(results)
             self.logger.info("Pass 1 (rules-based analysis) complete.")
             self.update_queue.put({'rules_pass_complete': True, 'results': results})
             return results
@@ -2,7 +2,11 @@
 import tkinter as tk
 from tkinter import ttk
 import platform
-import re # For update_treeview_item_tags
+import threading
+import time
+import weakref
+import functools
+import re # Speaker tag names and status keyword matching
 
 LIGHT_THEME = {
     "bg": "#ECECEC", "fg": "#000000", "frame_bg": "#F0F0F0", "text_bg": "#FFFFFF", "text_fg": "#000000",
@@ -24,151 +28,363 @@ DARK_THEME = {
     "scrollbar_bg": "#505050", "scrollbar_trough": "#3C3C3C", "labelframe_fg": "#E0E0E0"
 }
 
+def _build_widget_kwargs(c):
+    """Derive the per-widget-class option dicts for a theme palette once, instead of per widget."""
+    kwargs = {
+        "menu": dict(background=c["bg"], foreground=c["fg"], activebackground=c["select_bg"],
+                     activeforeground=c["select_fg"], relief=tk.FLAT, bd=0),
+        "menu_item": dict(background=c["bg"], foreground=c["fg"], activebackground=c["select_bg"],
+                          activeforeground=c["select_fg"], selectcolor=c["fg"]),
+        "frame": dict(background=c["frame_bg"]),
+        "label": dict(background=c["frame_bg"], foreground=c["fg"]),
+        "hint_label": dict(background=c["frame_bg"], foreground=c["disabled_fg"]),
+        "button": dict(background=c["button_bg"], foreground=c["button_fg"], activebackground=c["button_active_bg"],
+                       activeforeground=c["button_fg"], disabledforeground=c["disabled_fg"]),
+        "radiobutton": dict(background=c["button_bg"], foreground=c["button_fg"], activebackground=c["button_active_bg"],
+                            activeforeground=c["button_fg"], disabledforeground=c["disabled_fg"],
+                            selectcolor=c["frame_bg"], highlightthickness=0),
+        "labelframe": dict(background=c["frame_bg"], foreground=c["labelframe_fg"]),
+        "checkbutton": dict(background=c["frame_bg"], foreground=c["fg"], activebackground=c["frame_bg"],
+                            activeforeground=c["fg"], selectcolor=c["text_bg"], highlightthickness=0),
+        "editor": dict(background=c["text_bg"], foreground=c["text_fg"], insertbackground=c["cursor_color"],
+                       selectbackground=c["select_bg"], selectforeground=c["select_fg"]),
+        # Option database defaults, so tk widgets created after a theme switch start out themed
+        "option_db": (
+            ("*Frame.background", c["frame_bg"]),
+            ("*Label.background", c["frame_bg"]), ("*Label.foreground", c["fg"]),
+            ("*Button.background", c["button_bg"]), ("*Button.foreground", c["button_fg"]),
+            ("*Button.activeBackground", c["button_active_bg"]), ("*Button.activeForeground", c["button_fg"]),
+            ("*Button.disabledForeground", c["disabled_fg"]),
+            ("*Labelframe.background", c["frame_bg"]), ("*Labelframe.foreground", c["labelframe_fg"]),
+        ),
+    }
+    # menu_item as a flat Tcl option list (-background #fff ...) for _STYLE_MENU_ENTRIES_TCL
+    kwargs["menu_item_tcl_opts"] = tuple(part for key, value in kwargs["menu_item"].items() for part in (f"-{key}", value))
+    return kwargs
+
+# App attributes holding the widgets a theme switch walks, looked up by name since some are created lazily
+_MENU_ATTRS = ('menubar', 'theme_menu', 'tts_engine_menu', 'post_actions_menu')
+_TREE_ATTRS = ('tree', 'refinement_cast_tree', 'assignment_cast_tree', 'review_tree')
+_MAIN_VIEW_FRAME_ATTRS = ('wizard_frame', 'editor_frame', 'cast_refinement_frame', 'voice_assignment_frame', 'review_frame')
+
+# Resolved theme name -> palette; anything else ("dark") falls back to the dark palette
+THEMES_BY_NAME = {"light": LIGHT_THEME, "dark": DARK_THEME}
+
+# Status label colors of either palette, to keep an error/success color across a theme switch
+_ERROR_FGS = frozenset({LIGHT_THEME["error_fg"], DARK_THEME["error_fg"]})
+_SUCCESS_FGS = frozenset({LIGHT_THEME["success_fg"], DARK_THEME["success_fg"]})
+# ... or to infer it from the (lowercased) message text, one scan per keyword group
+_RE_ERROR_STATUS = re.compile(r'error|fail')
+_RE_SUCCESS_STATUS = re.compile(r'success|complete')
+
+# Built at import time; theme switches only pick the right one.
+_WIDGET_KWARGS = {id(LIGHT_THEME): _build_widget_kwargs(LIGHT_THEME), id(DARK_THEME): _build_widget_kwargs(DARK_THEME)}
+
+def widget_kwargs(colors):
+    """Return the precomputed widget option dicts for a theme palette."""
+    kwargs = _WIDGET_KWARGS.get(id(colors))
+    return kwargs if kwargs is not None else _build_widget_kwargs(colors)
+
+class ThemedWidgetSet(weakref.WeakSet):
+    """Weak registry of widgets to re-theme; destroyed widgets drop out instead of being kept alive.
+
+    Keeps the list-style append/extend the views use to register widgets; None entries are ignored.
+    """
+    def append(self, widget):
+        if widget is not None:
+            self.add(widget)
+
+    def extend(self, widgets):
+        for widget in widgets:
+            self.append(widget)
+
+# While following the OS theme, re-query it at most this often (seconds).
+SYSTEM_THEME_RECHECK_SECONDS = 30.0
+# Upper bound for the macOS `defaults read` call behind a system theme query (seconds).
+SYSTEM_THEME_QUERY_TIMEOUT = 5.0
+
 def initialize_theming(app):
-    detect_system_theme(app)
+    # Registry/`defaults` lookups stay off the UI thread; the result arrives via update_queue.
+    detect_system_theme_async(app)
+    if platform.system() == "Windows":
+        # Windows notifies us of theme changes, so apply_theme_settings never needs to re-query
+        app._system_theme_watched = True
+        threading.Thread(target=_watch_windows_theme, args=(app,), daemon=True).start()
     # In a real app, you might load saved theme preference here
     # app.current_theme_name = saved_preference or "system"
     # app.theme_var.set(app.current_theme_name)
 
-def detect_system_theme(app):
+def _query_system_theme(app):
+    """Return "light" or "dark" for the OS theme. Safe to call from a worker thread."""
     system_os = platform.system()
-    original_system_theme = app.system_actual_theme
     try:
         if system_os == "Windows":
             import winreg
-            key_path = r"Software\Microsoft\Windows\CurrentVersion\Themes\Personalize"
-            key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, key_path)
+            # Keep the Personalize key open; later checks only need QueryValueEx
+            key = getattr(app, '_winreg_key', None)
+            if key is None:
+                key_path = r"Software\Microsoft\Windows\CurrentVersion\Themes\Personalize"
+                key = app._winreg_key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, key_path)
             value, _ = winreg.QueryValueEx(key, "AppsUseLightTheme")
-            winreg.CloseKey(key)
-            app.system_actual_theme = "light" if value == 1 else "dark"
+            return "light" if value == 1 else "dark"
         elif system_os == "Darwin": # macOS
             import subprocess
             cmd = 'defaults read -g AppleInterfaceStyle'
-            p = subprocess.run(cmd.split(), capture_output=True, text=True, check=False)
+            # A wedged `defaults` must not pin the worker thread (or, via detect_system_theme, the UI)
+            p = subprocess.run(cmd.split(), capture_output=True, text=True, check=False, timeout=SYSTEM_THEME_QUERY_TIMEOUT)
             if p.stdout and p.stdout.strip() == 'Dark':
-                app.system_actual_theme = "dark"
-            else:
-                app.system_actual_theme = "light"
+                return "dark"
+            return "light"
         else: # Linux or other
-            app.system_actual_theme = "light"
+            return "light"
     except Exception as e:
+        app._winreg_key = None
         app.logic.logger.warning(f"Could not detect system theme on {system_os}: {e}. Defaulting to light.")
-        app.system_actual_theme = "light"
-    
+        return "light"
+
+def _watch_windows_theme(app):
+    """Block on RegNotifyChangeKeyValue for the Personalize key and post each new theme to update_queue."""
+    try:
+        import ctypes
+        from ctypes import wintypes
+        import winreg
+        advapi32, kernel32 = ctypes.windll.advapi32, ctypes.windll.kernel32
+        advapi32.RegNotifyChangeKeyValue.argtypes = [wintypes.HKEY, wintypes.BOOL, wintypes.DWORD, wintypes.HANDLE, wintypes.BOOL]
+        kernel32.CreateEventW.restype = wintypes.HANDLE
+        kernel32.WaitForSingleObject.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+        kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+        REG_NOTIFY_CHANGE_LAST_SET = 0x00000004
+        INFINITE = 0xFFFFFFFF
+
+        key_path = r"Software\Microsoft\Windows\CurrentVersion\Themes\Personalize"
+        # A dedicated handle: the query cache in _query_system_theme is used from other threads
+        key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, key_path, 0, winreg.KEY_NOTIFY | winreg.KEY_QUERY_VALUE)
+    except Exception as e:
+        app._system_theme_watched = False
+        app.logic.logger.warning(f"System theme change notifications unavailable: {e}")
+        return
+
+    event = kernel32.CreateEventW(None, False, False, None)
+    try:
+        while True:
+            # Notifications are one-shot, so re-arm before every wait
+            if advapi32.RegNotifyChangeKeyValue(key.handle, False, REG_NOTIFY_CHANGE_LAST_SET, event, True) != 0:
+                break
+            if kernel32.WaitForSingleObject(event, INFINITE) != 0:
+                break
+            value, _ = winreg.QueryValueEx(key, "AppsUseLightTheme")
+            app.update_queue.put({'system_theme_detected': "light" if value == 1 else "dark"})
+    except Exception as e:
+        app.logic.logger.warning(f"Stopped watching for system theme changes: {e}")
+    finally:
+        app._system_theme_watched = False
+        kernel32.CloseHandle(event)
+        key.Close()
+
+def detect_system_theme(app):
+    """Synchronously query the OS theme and re-apply if "system" is selected and it changed."""
+    app._system_theme_checked_at = time.monotonic()
+    on_system_theme_detected(app, _query_system_theme(app))
+
+def detect_system_theme_async(app):
+    """Query the OS theme on a worker thread; the UI thread applies it from the update queue."""
+    app._system_theme_checked_at = time.monotonic()
+    if platform.system() not in ("Windows", "Darwin"): # Nothing to query; don't pay for a thread
+        on_system_theme_detected(app, _query_system_theme(app))
+        return
+    threading.Thread(
+        target=lambda: app.update_queue.put({'system_theme_detected': _query_system_theme(app)}),
+        daemon=True
+    ).start()
+
+def on_system_theme_detected(app, theme):
+    original_system_theme = app.system_actual_theme
+    app.system_actual_theme = theme
     if original_system_theme != app.system_actual_theme:
         app.logic.logger.info(f"System theme changed to: {app.system_actual_theme}")
         if app.current_theme_name == "system":
-             apply_theme_settings(app)
+             app.schedule_theme_apply() # Debounced together with theme menu clicks
+
+# Tcl lambda (for `apply`) styling every command/radiobutton/checkbutton entry of menu $m with the option
+# list $opts. Runs inside Tcl, so a menu costs one round-trip instead of one index + a type/entryconfigure per entry.
+# `index end` is "none" (Tk 8.6) or "" (Tk 9) for a menu with no entries.
+_STYLE_MENU_ENTRIES_TCL = """{m opts} {
+    set last [$m index end]
+    if {$last eq "none" || $last eq ""} return
+    for {set i 0} {$i <= $last} {incr i} {
+        if {[$m type $i] in {command radiobutton checkbutton}} {
+            $m entryconfigure $i {*}$opts
+        }
+    }
+}"""
 
 def style_menu(menu, colors, logger):
     """Helper function to apply theme styles to a menu and its items."""
     if not menu: return
+    kwargs = widget_kwargs(colors)
     try:
-        menu.config(
-            background=colors["bg"], 
-            foreground=colors["fg"],
-            activebackground=colors["select_bg"],
-            activeforeground=colors["select_fg"],
-            relief=tk.FLAT,
-            bd=0 # No border
-        )
+        menu.config(**kwargs["menu"])
         # Style each item in the menu
-        for i in range(menu.index(tk.END) + 1):
-            if menu.type(i) in ["command", "radiobutton", "checkbutton"]:
-                menu.entryconfigure(i, 
-                    background=colors["bg"], 
-                    foreground=colors["fg"],
-                    activebackground=colors["select_bg"],
-                    activeforeground=colors["select_fg"],
-                    selectcolor=colors["fg"] # For radio/check buttons
-                )
+        menu.tk.call('apply', _STYLE_MENU_ENTRIES_TCL, menu._w, kwargs["menu_item_tcl_opts"])
     except (tk.TclError, AttributeError) as e:
         logger.debug(f"Note: Could not fully style menu items (OS limitations likely): {e}")
 
-def apply_theme_settings(app):
+def apply_theme_settings(app, force=False):
     if not hasattr(app, 'status_label'): # Widgets not created yet
         return
 
     theme_to_apply = app.current_theme_name
     if theme_to_apply == "system":
-        detect_system_theme(app) 
+        # Use the cached OS theme; refresh it in the background when it is stale
+        checked_at = getattr(app, '_system_theme_checked_at', None)
+        # Not needed while the Windows registry watcher pushes changes as they happen
+        stale = checked_at is None or time.monotonic() - checked_at >= SYSTEM_THEME_RECHECK_SECONDS
+        if stale and not app._system_theme_watched:
+            detect_system_theme_async(app)
         theme_to_apply = app.system_actual_theme
+
+    # e.g. "system" -> "light" while the OS is already light: nothing visible changes
+    if not force and getattr(app, '_last_applied_theme', None) == theme_to_apply and app._theme_colors:
+        return
+    app._last_applied_theme = theme_to_apply
     
-    app._theme_colors = LIGHT_THEME if theme_to_apply == "light" else DARK_THEME
+    c = app._theme_colors = THEMES_BY_NAME.get(theme_to_apply, DARK_THEME)
     
-    app.root.config(background=app._theme_colors["bg"])
-    app.config(background=app._theme_colors["bg"]) 
+    app.root.config(background=c["bg"])
+    app.config(background=c["bg"]) 
     
     # Apply theme to all menus
-    menus_to_style = [
-        getattr(app, 'menubar', None),
-        getattr(app, 'theme_menu', None),
-        getattr(app, 'tts_engine_menu', None),
-        getattr(app, 'post_actions_menu', None)
-    ]
-    for menu in menus_to_style:
-        style_menu(menu, app._theme_colors, app.logic.logger)
+    logger = app.logic.logger
+    for menu_attr in _MENU_ATTRS:
+        style_menu(getattr(app, menu_attr, None), c, logger)
 
     apply_standard_tk_styles(app)
     apply_ttk_styles(app)
 
-    update_treeview_item_tags(app, app.tree)
-    update_treeview_item_tags(app, app.refinement_cast_tree)
-    update_treeview_item_tags(app, app.assignment_cast_tree)
-    if hasattr(app, 'review_tree') and app.review_tree: # review_tree might not be initialized
-        update_treeview_item_tags(app, app.review_tree)
+    # Rows reference colors through tag names, so a theme switch only has to redefine the tags,
+    # and only when the stripe colors differ (speaker colors do not depend on the theme).
+    row_tag_colors = (c["tree_even_row_bg"], c["tree_odd_row_bg"])
+    if force or row_tag_colors != getattr(app, '_last_row_tag_colors', None):
+        app._last_row_tag_colors = row_tag_colors
+        for tree_attr in _TREE_ATTRS: # review_tree might not be initialized; None is skipped
+            configure_treeview_tags(app, getattr(app, tree_attr, None))
         
     update_status_label_color(app)
     if hasattr(app, 'editor_view') and hasattr(app.editor_view, 'text_editor'): # Check if editor_view and its text_editor exist
-        app.editor_view.text_editor.config(
-            background=app._theme_colors["text_bg"], foreground=app._theme_colors["text_fg"],
-            insertbackground=app._theme_colors["cursor_color"],
-            selectbackground=app._theme_colors["select_bg"], selectforeground=app._theme_colors["select_fg"]
-        )
-
-def apply_standard_tk_styles(app):
-    """Applies theme to standard Tkinter widgets."""
-    c = app._theme_colors
+        app.editor_view.text_editor.config(**widget_kwargs(c)["editor"])
+
+def _main_view_frames(app):
+    return [f for f in (getattr(app, name, None) for name in _MAIN_VIEW_FRAME_ATTRS) if f is not None]
+
+def _owning_view_frame(app, widget):
+    """The main view frame `widget` is (or sits inside), or None for chrome shown with every view.
+
+    Widgets never move between frames, so the answer is cached per widget.
+    """
+    owners = app._theme_widget_owners
+    try:
+        return owners[widget]
+    except KeyError:
+        path = str(widget)
+        view_frames = _main_view_frames(app)
+        owner = next((f for f in view_frames if path == str(f) or path.startswith(str(f) + '.')), None)
+        if len(view_frames) == len(_MAIN_VIEW_FRAME_ATTRS): # Not while the views are still being built
+            owners[widget] = owner
+        return owner
+
+def restyle_if_stale(app, view_frame):
+    """Applies the current theme to a main view frame that was hidden during the last theme switch."""
+    if view_frame in app._theme_stale_frames and app._theme_colors:
+        apply_standard_tk_styles(app, within=view_frame)
+
+def apply_standard_tk_styles(app, within=None):
+    """Applies theme to standard Tkinter widgets.
+
+    Widgets inside main view frames other than the one currently raised are skipped and their frame is marked
+    stale; restyle_if_stale() themes it when the view is shown. Pass `within` to style one frame's subtree.
+    """
+    kwargs = widget_kwargs(app._theme_colors)
+    frame_kwargs, label_kwargs = kwargs["frame"], kwargs["label"]
+
+    # The option database only applies to widgets created from now on; existing ones are configured below
+    if getattr(app, '_option_db_colors', None) is not app._theme_colors:
+        app._option_db_colors = app._theme_colors
+        option_add = app.root.option_add
+        for pattern, value in kwargs["option_db"]:
+            option_add(pattern, value)
+
+    stale = app._theme_stale_frames
+    if within is not None:
+        stale.discard(within)
+        def in_scope(widget):
+            return _owning_view_frame(app, widget) is within
+    else:
+        stale.clear()
+        for view_frame in _main_view_frames(app):
+            if view_frame is not app._current_view_frame: # Not shown; restyled when it is next shown
+                stale.add(view_frame)
+        def in_scope(widget):
+            return _owning_view_frame(app, widget) not in stale
 
     # Apply theme to all registered frames.
     # Views are responsible for registering their frames in app._themed_tk_frames.
     for frame in app._themed_tk_frames:
-        if frame: frame.config(background=c["frame_bg"])
+        if not in_scope(frame): continue
+        try:
+            frame.config(**frame_kwargs)
+        except tk.TclError: # Destroyed but not yet garbage collected
+            pass
 
+    drop_info_label = getattr(app.wizard_view, 'drop_info_label', None)
     for label in app._themed_tk_labels:
-        if label:
+        if not in_scope(label): continue
+        try:
             if label == app.status_label:
-                label.config(background=c["frame_bg"]) 
+                label.config(**frame_kwargs)
             # Special styling for the drag-and-drop prompt label
-            elif hasattr(app.wizard_view, 'drop_info_label') and label == app.wizard_view.drop_info_label:
-                 label.config(background=c["frame_bg"], foreground=c["disabled_fg"])
+            elif drop_info_label is not None and label == drop_info_label:
+                 label.config(**kwargs["hint_label"])
             else:
-                label.config(background=c["frame_bg"], foreground=c["fg"])
+                label.config(**label_kwargs)
+        except tk.TclError:
+            pass
     
     for button in app._themed_tk_buttons:
-        if button:
-            button.config(
-                background=c["button_bg"], foreground=c["button_fg"],
-                activebackground=c["button_active_bg"], activeforeground=c["button_fg"],
-                disabledforeground=c["disabled_fg"]
-            )
-            if isinstance(button, tk.Radiobutton):
-                button.config(
-                    selectcolor=c["frame_bg"],
-                    highlightthickness=0,
-                )
+        if not in_scope(button): continue
+        try:
+            # Radiobuttons take the button colors plus their indicator options in the same call
+            button.config(**kwargs["radiobutton" if isinstance(button, tk.Radiobutton) else "button"])
+        except tk.TclError:
+            pass
     
     for labelframe in app._themed_tk_labelframes:
-        if labelframe:
-            labelframe.config(background=c["frame_bg"], foreground=c["labelframe_fg"])
+        if not in_scope(labelframe): continue
+        try:
+            labelframe.config(**kwargs["labelframe"])
             for child in labelframe.winfo_children():
                 if isinstance(child, tk.Label):
-                    child.config(background=c["frame_bg"], foreground=c["fg"])
+                    child.config(**label_kwargs)
+        except tk.TclError:
+            pass
+
+    for checkbutton in app._themed_tk_checkbuttons:
+        if not in_scope(checkbutton): continue
+        try:
+            checkbutton.config(**kwargs["checkbutton"])
+        except tk.TclError:
+            pass
 
 def apply_ttk_styles(app):
     """Applies theme to TTK widgets using ttk.Style."""
-    style = ttk.Style(app.root)
     c = app._theme_colors
+    if hasattr(app, 'progressbar'):
+         app.progressbar.configure(style="Horizontal.TProgressbar")
+    # Styles are global to the interpreter and picked up by new widgets, so an unchanged palette
+    # needs no style.configure/option_add round-trips (even for a forced re-theme)
+    if getattr(app, '_ttk_styled_colors', None) is c:
+        return
+    app._ttk_styled_colors = c
+    style = ttk.Style(app.root)
 
     # style.theme_use('clam')  # Disable TTK theming that overrides colors 
 
@@ -199,61 +415,82 @@ def apply_ttk_styles(app):
     app.root.option_add("*TCombobox*Listbox.selectBackground", c["select_bg"])
     app.root.option_add("*TCombobox*Listbox.selectForeground", c["select_fg"]) # type: ignore
     
-    style.configure("TProgressbar", troughcolor=c["progressbar_trough"], background=c["progressbar_bar"], thickness=15)
-    style.configure("Horizontal.TProgressbar", troughcolor=c["progressbar_trough"], background=c["progressbar_bar"], thickness=15)
-    style.configure("Vertical.TProgressbar", troughcolor=c["progressbar_trough"], background=c["progressbar_bar"], thickness=15)
-    
-    if hasattr(app, 'progressbar'):
-         app.progressbar.configure(style="Horizontal.TProgressbar")
+    progressbar_opts = {"troughcolor": c["progressbar_trough"], "background": c["progressbar_bar"], "thickness": 15}
+    for progressbar_style in ("TProgressbar", "Horizontal.TProgressbar", "Vertical.TProgressbar"):
+        style.configure(progressbar_style, **progressbar_opts)
 
     style.configure("TScrollbar", background=c["scrollbar_bg"], troughcolor=c["scrollbar_trough"], relief=tk.FLAT, arrowcolor=c["fg"])
     style.map("TScrollbar", background=[('active', c["button_active_bg"])])
 
-def update_treeview_item_tags(app, treeview_widget):
+_RE_TAG_UNSAFE_CHARS = re.compile(r'[^a-zA-Z0-9_]')
+
+@functools.lru_cache(maxsize=None) # Called per row; a script only has a handful of distinct speakers
+def speaker_tag_name(speaker):
+    """Treeview tag carrying a speaker's foreground color."""
+    return f"speaker_{_RE_TAG_UNSAFE_CHARS.sub('_', speaker)}"
+
+def configure_treeview_tags(app, treeview_widget):
+    """Define the row-stripe and speaker color tags on a tree. O(speakers), rows are untouched."""
     if not treeview_widget or not app._theme_colors: return
     c = app._theme_colors
-    treeview_widget.tag_configure('oddrow', background=c["tree_odd_row_bg"])
-    treeview_widget.tag_configure('evenrow', background=c["tree_even_row_bg"])
+    tag_configure = treeview_widget.tag_configure
+    tag_configure('oddrow', background=c["tree_odd_row_bg"])
+    tag_configure('evenrow', background=c["tree_even_row_bg"])
 
     for speaker, color in app.state.speaker_colors.items():
-        tag_name = f"speaker_{re.sub(r'[^a-zA-Z0-9_]', '', speaker)}"
-        treeview_widget.tag_configure(tag_name, foreground=color)
+        tag_configure(speaker_tag_name(speaker), foreground=color)
+
+def update_treeview_item_tags(app, treeview_widget):
+    """Define the tags and re-assign stripe/speaker tags on every row (after rows were added or reordered)."""
+    if not treeview_widget or not app._theme_colors: return
+    c = app._theme_colors
+    speaker_colors = app.state.speaker_colors
+    # Only (re)define the tags when the stripe or speaker colors changed since this tree was last tagged
+    tag_signature = (c["tree_odd_row_bg"], c["tree_even_row_bg"], tuple(speaker_colors.items()))
+    tag_signatures = getattr(app, '_tree_tag_signatures', None)
+    if tag_signatures is None: tag_signatures = app._tree_tag_signatures = {}
+    if tag_signatures.get(str(treeview_widget)) != tag_signature:
+        configure_treeview_tags(app, treeview_widget)
+        tag_signatures[str(treeview_widget)] = tag_signature
+
+    # Loop-invariant lookups hoisted out of the per-row loop
+    speaker_val_index = 1 if treeview_widget == app.review_tree else 0 # Speaker column: 0 for app.tree and both cast trees
+    item = treeview_widget.item
+    logger = app.logic.logger
 
     children = treeview_widget.get_children('')
     for i, item_id in enumerate(children):
-        current_tags = list(treeview_widget.item(item_id, 'tags'))
-        current_tags = [t for t in current_tags if not t.startswith('speaker_') and t not in ('oddrow', 'evenrow')]
+        old_tags = item(item_id, 'tags') or ()
+        current_tags = [t for t in old_tags if not t.startswith('speaker_') and t not in ('oddrow', 'evenrow')]
         current_tags.append('evenrow' if i % 2 == 0 else 'oddrow')
         try:
-            speaker_val_index = 0 # Default for app.tree and both cast trees
-            if treeview_widget == app.review_tree: 
-                speaker_val_index = 1 
-            
-            item_values = treeview_widget.item(item_id, 'values')
+            item_values = item(item_id, 'values')
             if item_values and len(item_values) > speaker_val_index:
                 speaker_val = item_values[speaker_val_index]
-                speaker_color_tag = app.get_speaker_color_tag(speaker_val) 
+                # Tags for known speakers were defined by configure_treeview_tags above
+                speaker_color_tag = speaker_tag_name(speaker_val) if speaker_val in speaker_colors else "default_tag"
                 if speaker_color_tag not in current_tags: current_tags.append(speaker_color_tag)
             else: # Handle cases where item might not have expected values (e.g. during deletion/repopulation)
-                app.logic.logger.debug(f"Treeview item {item_id} in {treeview_widget} had unexpected values: {item_values}")
+                logger.debug(f"Treeview item {item_id} in {treeview_widget} had unexpected values: {item_values}")
 
         except (IndexError, tk.TclError) as e: 
-            app.logic.logger.debug(f"Error accessing item {item_id} values or tags in {treeview_widget} during theme update: {e}")
-        treeview_widget.item(item_id, tags=tuple(current_tags))
+            logger.debug(f"Error accessing item {item_id} values or tags in {treeview_widget} during theme update: {e}")
+        # Rows whose parity and speaker did not change already carry the right tags
+        if tuple(old_tags) != tuple(current_tags):
+            item(item_id, tags=tuple(current_tags))
 
 def update_status_label_color(app):
     if not hasattr(app, 'status_label') or not app._theme_colors: return
     c = app._theme_colors
-    current_text = app.status_label.cget("text")
-    current_fg_str = str(app.status_label.cget("fg"))
-
-    is_error = current_fg_str == LIGHT_THEME["error_fg"] or current_fg_str == DARK_THEME["error_fg"]
-    is_success = current_fg_str == LIGHT_THEME["success_fg"] or current_fg_str == DARK_THEME["success_fg"]
+    status_label = app.status_label
+    current_text = status_label.cget("text").lower()
+    current_fg_str = str(status_label.cget("fg"))
 
-    if "error" in current_text.lower() or "fail" in current_text.lower() or is_error:
-        app.status_label.config(foreground=c["error_fg"])
-    elif "success" in current_text.lower() or "complete" in current_text.lower() or is_success:
-        app.status_label.config(foreground=c["success_fg"])
+    # Color checks first: they are set membership tests, the keyword checks scan the text
+    if current_fg_str in _ERROR_FGS or _RE_ERROR_STATUS.search(current_text):
+        foreground = c["error_fg"]
+    elif current_fg_str in _SUCCESS_FGS or _RE_SUCCESS_STATUS.search(current_text):
+        foreground = c["success_fg"]
     else:
-        app.status_label.config(foreground=c["status_fg"])
-    app.status_label.config(background=c["frame_bg"])
\ No newline at end of file
+        foreground = c["status_fg"]
+    status_label.config(foreground=foreground, background=c["frame_bg"])
\ No newline at end of file
@@ -4,10 +4,18 @@ import traceback
 from abc import ABC, abstractmethod
 from pathlib import Path
 import shutil
+import subprocess
+import sys
 import threading
+from concurrent.futures import ThreadPoolExecutor
 import time
 import re
+import hashlib
 import importlib.util
+import queue
+import contextlib
+import functools
+import tempfile
 
 import torch
 
@@ -41,6 +49,128 @@ def _cuda_runtime_available(logger) -> bool:
         return False
 
 
+@functools.lru_cache(maxsize=4096)
+def _parse_trainer_line(line: str) -> dict | None:
+    """Memoized core of CoquiXTTS._parse_trainer_output; trainers repeat many status lines verbatim."""
+    l = line.strip()
+    # Every metric we extract is numeric; skip banners/tracebacks without running the regexes.
+    if not any(c.isdigit() for c in l):
+        return None
+    parsed: dict = {'raw': line}
+
+    # Common epoch format: "Epoch: 1/100" or "Epoch 1/100"
+    m = _RE_EPOCH.search(l)
+    if m:
+        parsed['epoch'] = int(m.group(1))
+        parsed['epoch_total'] = int(m.group(2))
+
+    # Step/iteration progress: tqdm-style [10/100] (the Coqui/HF trainer default) or 'Step: 10/100'
+    m = _RE_BRACKET_STEP.search(l) if '[' in l else None
+    m = _RE_STEP.search(l) or m
+    if m:
+        parsed['step'] = int(m.group(1))
+        parsed['step_total'] = int(m.group(2))
+
+    # Explicit percent like '12%' wins; otherwise derive it from step, then epoch counts
+    m = _RE_PCT.search(l) if '%' in l else None
+    if m:
+        parsed['percent'] = float(m.group(1))
+    elif parsed.get('step_total'):
+        parsed['percent'] = parsed['step'] * 100.0 / parsed['step_total']
+    elif parsed.get('epoch_total'):
+        parsed['percent'] = parsed['epoch'] * 100.0 / parsed['epoch_total']
+
+    # Loss field like 'loss: 0.1234' or 'Loss=0.1234'
+    m = _RE_LOSS.search(l)
+    if m:
+        try:
+            parsed['loss'] = float(m.group(1))
+        except ValueError:
+            parsed['loss'] = m.group(1)
+
+    # ETA patterns: 'ETA: 00:20' or progressbar-like '<00:20,'
+    m = _RE_ETA.search(l) or (_RE_BAR_ETA.search(l) if '<' in l else None)
+    if m:
+        parsed['eta'] = m.group(1)
+
+    # If no meaningful keys other than raw, return None
+    if len(parsed) == 1:
+        return None
+    return parsed
+
+
+def _ingest_wav(src: Path, dst: Path):
+    """Place src at dst as cheaply as possible: hardlink, then copy-on-write reflink, then a full copy."""
+    try:
+        os.link(src, dst)
+        return
+    except OSError:
+        pass  # Cross-device link or filesystem refuses hardlinks
+    if sys.platform.startswith('linux'):
+        try:
+            # --reflink=auto is a metadata-only clone on btrfs/xfs and a normal copy elsewhere
+            result = subprocess.run(['cp', '--reflink=auto', '--preserve=timestamps', str(src), str(dst)],
+                                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            if result.returncode == 0:
+                return
+        except OSError:
+            pass
+    shutil.copy2(src, dst)
+
+
+@contextlib.contextmanager
+def _mmap_checkpoint_loads(logger):
+    """Route XTTS checkpoint reads through an mmap'd, weights-only torch.load.
+
+    Xtts.load_checkpoint reads through TTS.utils.io.load_fsspec, which materializes the whole
+    multi-GB file in RAM. With mmap the OS pages tensors in on demand, roughly halving peak RSS.
+    """
+    import TTS.tts.models.xtts as xtts_module
+    original_load = xtts_module.load_fsspec
+
+    def _load(path, map_location=None, **kwargs):
+        if isinstance(path, (str, os.PathLike)) and os.path.isfile(path):
+            try:
+                return torch.load(path, map_location='cpu', mmap=True, weights_only=True)
+            except Exception as e:
+                logger.debug(f"mmap checkpoint load failed for {path}, using default loader: {e}")
+        return original_load(path, map_location=map_location, **kwargs)
+
+    xtts_module.load_fsspec = _load
+    try:
+        yield
+    finally:
+        xtts_module.load_fsspec = original_load
+
+
+def _compile_requested() -> bool:
+    """True when the user opted into torch.compile via RADIOSHOW_TTS_COMPILE=1."""
+    value = os.environ.get('RADIOSHOW_TTS_COMPILE', '0').strip().lower()
+    return value in ('1', 'true', 'yes', 'on') and hasattr(torch, 'compile')
+
+
+def _limit_cpu_threads(logger):
+    """Cap torch/BLAS threads for CPU inference to avoid oversubscription on small GEMMs.
+
+    RADIOSHOW_TTS_CPU_THREADS overrides the default (half the cores, at most 4). torch is already
+    imported with its OpenMP pool set up by now, so this goes through torch's own setters rather than
+    OMP_NUM_THREADS/MKL_NUM_THREADS, which are only read at initialisation.
+    """
+    default_threads = max(1, min(4, (os.cpu_count() or 2) // 2))
+    try:
+        threads = max(1, int(os.environ.get('RADIOSHOW_TTS_CPU_THREADS', default_threads)))
+    except ValueError:
+        logger.warning(f"Invalid RADIOSHOW_TTS_CPU_THREADS value '{os.environ.get('RADIOSHOW_TTS_CPU_THREADS')}'; using {default_threads}.")
+        threads = default_threads
+    torch.set_num_threads(threads)
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        # Can only be set once, before any inter-op parallel work has started.
+        pass
+    logger.info(f"CPU inference: limiting torch to {threads} thread(s) to avoid BLAS oversubscription (set RADIOSHOW_TTS_CPU_THREADS to override).")
+
+
 def _looks_like_windows_paging_error(error_text: str) -> bool:
     """Detect common Windows paging/virtual-memory loader failures."""
     text = (error_text or "").lower()
@@ -50,6 +180,35 @@ def _looks_like_windows_paging_error(error_text: str) -> bool:
         or "[errno 1455]" in text
     )
 
+def _resolve_autocast_dtype(logger):
+    """Return the autocast dtype for CUDA inference, or None to run in FP32.
+
+    Reads RADIOSHOW_TTS_PRECISION ('fp32'|'fp16'|'bf16'). When unset, FP16 is used on
+    Volta (sm70) or newer GPUs and FP32 everywhere else.
+    """
+    raw_value = os.environ.get('RADIOSHOW_TTS_PRECISION')
+    value = (raw_value or '').strip().lower()
+    if not value:
+        try:
+            major, _ = torch.cuda.get_device_capability()
+        except Exception:
+            major = 0
+        value = 'fp16' if major >= 7 else 'fp32'
+    elif value not in ('fp32', 'fp16', 'bf16'):
+        logger.warning(f"Unknown RADIOSHOW_TTS_PRECISION value '{raw_value}'; using fp32.")
+        value = 'fp32'
+
+    if value == 'bf16' and not torch.cuda.is_bf16_supported():
+        logger.warning("RADIOSHOW_TTS_PRECISION=bf16 requested, but this GPU does not support bfloat16; using fp32.")
+        value = 'fp32'
+    return {'fp16': torch.float16, 'bf16': torch.bfloat16}.get(value)
+
+
+def _enable_tf32():
+    """Allow TF32 tensor-core math for matmuls/convolutions that stay in FP32."""
+    torch.backends.cuda.matmul.allow_tf32 = True
+    torch.backends.cudnn.allow_tf32 = True
+
 # Need to handle potential ModuleNotFoundError for TTS and Chatterbox
 try:
     from TTS.api import TTS
@@ -61,10 +220,40 @@ except ImportError:
     TTS, XttsConfig, XttsAudioConfig, XttsArgs, BaseDatasetConfig = None, None, None, None, None
     TTS_AVAILABLE = False
 
+# Trainer output patterns, compiled once since they run against every streamed log line.
+_RE_EPOCH = re.compile(r'[Ee]poch[: ]*\s*(\d+)\s*/\s*(\d+)')
+_RE_STEP = re.compile(r'[Ss]tep[: ]*\s*(\d+)\s*/\s*(\d+)')
+_RE_BRACKET_STEP = re.compile(r'\[(\d+)\s*/\s*(\d+)(?:[^\]]*)\]')
+_RE_PCT = re.compile(r'(\d{1,3})\s*%')
+_RE_LOSS = re.compile(r'loss[:=]\s*([0-9]*\.?[0-9]+)', re.I)
+_RE_ETA = re.compile(r'ETA[:=]?\s*([0-9hms:]+)', re.I)
+_RE_BAR_ETA = re.compile(r'<\s*([0-9:]+)\s*,')
+
+# Max Chatterbox clips waiting to be written to disk before generation waits for the writer.
+MAX_PENDING_WRITES = 8
+
+# On-disk XTTS speaker latent cache is pruned (oldest first) beyond this size.
+LATENT_CACHE_MAX_BYTES = 500 * 1024 * 1024
+
+# Max trainer output lines buffered between the pipe reader and the UI/log consumer.
+TRAINER_LINE_QUEUE_SIZE = 10000
+# Bytes requested per os.read() on the trainer's stdout pipe.
+TRAINER_READ_CHUNK = 64 * 1024
+# Buffer size for streaming metadata.csv during training-set preparation.
+METADATA_IO_BUFFER = 1024 * 1024
+# Seconds between batched trainer updates pushed to the UI queue / log window.
+TRAINER_UI_FLUSH_INTERVAL = 0.1
+
+XTTS_MODEL_NAME = "tts_models/multilingual/multi-dataset/xtts_v2"
+# DeepSpeed is optional; when present XTTS can use its fused inference kernels on CUDA.
+DEEPSPEED_AVAILABLE = importlib.util.find_spec("deepspeed") is not None
+
 # Keep Chatterbox imports lazy to avoid expensive/fragile import chains at app startup.
 ChatterboxTTSModule, torchaudio = None, None
 CHATTERBOX_AVAILABLE = (
-    importlib.util.find_spec("chatterbox.tts") is not None
+    # find_spec("chatterbox.tts") raises ModuleNotFoundError rather than returning None when the package is absent
+    importlib.util.find_spec("chatterbox") is not None
+    and importlib.util.find_spec("chatterbox.tts") is not None
     and importlib.util.find_spec("torchaudio") is not None
 )
 
@@ -74,6 +263,54 @@ class TTSEngine(ABC):
         self.ui = ui
         self.logger = logger
         self.engine = None # The actual TTS library engine instance
+        self._autocast_dtype = None # Set during initialize() when running on CUDA
+
+    def _configure_cuda_precision(self):
+        """Enable TF32 and pick the autocast dtype used around CUDA synthesis."""
+        _enable_tf32()
+        self._autocast_dtype = _resolve_autocast_dtype(self.logger)
+        precision = str(self._autocast_dtype).replace('torch.', '') if self._autocast_dtype else 'float32'
+        self.logger.info(f"{self.get_engine_name()} CUDA inference precision: {precision}.")
+
+    def _autocast(self):
+        """Context manager applying mixed-precision autocast when configured, else a no-op."""
+        if self._autocast_dtype is None:
+            return contextlib.nullcontext()
+        return torch.autocast(device_type='cuda', dtype=self._autocast_dtype)
+
+    def _freeze_for_inference(self, modules):
+        """Put torch modules in eval mode with gradients disabled; inference never needs autograd state."""
+        for module in modules:
+            if not isinstance(module, torch.nn.Module):
+                continue
+            module.eval()
+            for param in module.parameters():
+                param.requires_grad_(False)
+
+    def _compile_submodules(self, model, names) -> bool:
+        """torch.compile the named submodules of model in place. Returns True if any were compiled."""
+        compiled = False
+        for name in names:
+            module = getattr(model, name, None)
+            if module is None or not hasattr(module, 'compile'):
+                continue
+            try:
+                # dynamic=True: sequence lengths vary per line, avoid a recompile for every new shape.
+                module.compile(dynamic=True, fullgraph=False)
+                compiled = True
+                self.logger.info(f"{self.get_engine_name()}: compiled submodule '{name}' with torch.compile.")
+            except Exception as e:
+                self.logger.warning(f"{self.get_engine_name()}: torch.compile failed for '{name}', continuing uncompiled: {e}")
+        return compiled
+
+    def _warmup(self, **kwargs):
+        """Run a short throwaway synthesis so compilation happens during initialize, not on the first real line."""
+        self.ui.update_queue.put({'status': f"Warming up {self.get_engine_name()} (compiling kernels)..."})
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            try:
+                self.tts_to_file("Warming up the voice engine.", str(Path(tmp_dir) / "warmup.wav"), **kwargs)
+            except Exception as e:
+                self.logger.warning(f"{self.get_engine_name()} warm-up synthesis failed: {e}")
 
     @abstractmethod
     def initialize(self):
@@ -85,6 +322,11 @@ class TTSEngine(ABC):
         """Synthesizes text to an audio file."""
         pass
 
+    def flush(self) -> list:
+        """Block until any deferred audio writes have finished and return the paths whose write failed.
+        Engines that write synchronously need nothing here."""
+        return []
+
     @abstractmethod
     def get_engine_specific_voices(self) -> list:
         """Returns a list of voice-like objects specific to this engine."""
@@ -133,12 +375,32 @@ class CoquiXTTS(TTSEngine):
                 self.logger.info("Attempting to initialize XTTS with GPU support")
             else:
                 self.logger.info("Initializing XTTS on CPU")
+                _limit_cpu_threads(self.logger)
                 if device_pref == 'auto':
                     self.logger.info("No CUDA device detected. To enable GPU, install a CUDA-enabled PyTorch and set RADIOSHOW_TTS_DEVICE=cuda or an explicit cuda device id.")
 
-            self.engine = TTS("tts_models/multilingual/multi-dataset/xtts_v2", progress_bar=False, gpu=gpu_available)
+            use_deepspeed = gpu_available and DEEPSPEED_AVAILABLE
+            if use_deepspeed:
+                self.logger.info("DeepSpeed found; loading XTTS with DeepSpeed inference kernels.")
+            elif gpu_available:
+                self.logger.warning("DeepSpeed is not installed; XTTS will run without fused inference kernels. Install it with `pip install deepspeed` (or a prebuilt Windows wheel) for faster GPU synthesis.")
+            try:
+                self.engine = self._load_xtts_model(use_deepspeed=use_deepspeed, use_gpu=gpu_available)
+                self._direct_xtts = True
+            except Exception as e:
+                self.logger.warning(f"Direct XTTS load failed ({e}); falling back to the TTS API loader.")
+                self._direct_xtts = False
+                self.engine = TTS(XTTS_MODEL_NAME, progress_bar=False, gpu=gpu_available)
+                self._model_identity = XTTS_MODEL_NAME
+            # Latents held in memory belong to the previously loaded model.
+            self._latent_cache = {}
+            self._freeze_for_inference([self._xtts_model()])
 
+            self._autocast_dtype = None
             if gpu_available:
+                self._configure_cuda_precision()
+                if _compile_requested() and self._compile_submodules(self._xtts_model(), ('gpt', 'hifigan_decoder')):
+                    self._warmup(internal_speaker_name="Claribel Dervla", language='en')
                 self.logger.info("XTTS initialized with GPU support")
             else:
                 self.logger.info("XTTS initialized with CPU (no GPU available)")
@@ -151,6 +413,113 @@ class CoquiXTTS(TTSEngine):
             self.ui.update_queue.put({'error': f"Could not initialize Coqui XTTS.\n\nDETAILS:\n{detailed_error}"})
             return False
 
+    def _xtts_model(self):
+        """Return the underlying Xtts torch module regardless of how the engine was loaded."""
+        if getattr(self, '_direct_xtts', False):
+            return self.engine
+        return self.engine.synthesizer.tts_model
+
+    def _load_xtts_model(self, use_deepspeed: bool = False, use_gpu: bool = True):
+        """Load the XTTS model directly (bypassing TTS.api) so loader options like DeepSpeed and mmap can be set."""
+        from TTS.utils.manage import ModelManager
+        from TTS.tts.models.xtts import Xtts
+
+        model_dir, _, _ = ModelManager().download_model(XTTS_MODEL_NAME)
+        checkpoint = Path(model_dir) / "model.pth"
+        checkpoint_mtime = checkpoint.stat().st_mtime_ns if checkpoint.is_file() else 0
+        self._model_identity = f"{XTTS_MODEL_NAME}:{Path(model_dir).resolve()}:{checkpoint_mtime}"
+        config = XttsConfig()
+        config.load_json(os.path.join(model_dir, "config.json"))
+        model = Xtts.init_from_config(config)
+        with _mmap_checkpoint_loads(self.logger):
+            model.load_checkpoint(config, checkpoint_dir=model_dir, use_deepspeed=use_deepspeed)
+        if use_gpu:
+            model.to('cuda', non_blocking=True)
+        return model
+
+    def _direct_tts_to_file(self, text: str, file_path: str, coqui_kwargs: dict):
+        """Synthesize with a directly loaded Xtts model and write the result as a WAV file."""
+        from TTS.utils.audio.numpy_transforms import save_wav
+
+        config = self.engine.config
+        outputs = self.engine.synthesize(
+            text,
+            config,
+            speaker_wav=coqui_kwargs.get('speaker_wav'),
+            language=coqui_kwargs.get('language', 'en'),
+            speaker_id=coqui_kwargs.get('speaker'),
+            enable_text_splitting=True,
+        )
+        save_wav(wav=outputs['wav'], path=file_path, sample_rate=config.audio.output_sample_rate)
+
+    def _latent_cache_dir(self) -> Path:
+        return self.ui.state.output_dir / "XTTS_Model" / ".latent_cache"
+
+    def _speaker_latents(self, speaker_wav_path):
+        """Return (gpt_cond_latent, speaker_embedding) for a reference wav.
+
+        Latents are deterministic per file and model, so they are cached in memory and on
+        disk (keyed by path, mtime and size plus the loaded checkpoint, device and autocast
+        dtype) and the speaker encoder only runs once per voice.
+        """
+        model = self._xtts_model()
+        wav_path = Path(speaker_wav_path).resolve()
+        stat = wav_path.stat()
+        model_tag = f"{getattr(self, '_model_identity', XTTS_MODEL_NAME)}:{model.device}:{getattr(self, '_autocast_dtype', None)}"
+        key = hashlib.sha1(f"{wav_path}:{stat.st_mtime_ns}:{stat.st_size}:{model_tag}".encode()).hexdigest()
+
+        memory_cache = self._latent_cache
+        if key in memory_cache:
+            return memory_cache[key]
+
+        cache_dir = self._latent_cache_dir()
+        cache_file = cache_dir / f"{key}.pt"
+        latents = None
+        if cache_file.is_file():
+            try:
+                latents = tuple(torch.load(cache_file, map_location=model.device, weights_only=True))
+                os.utime(cache_file)  # Mark as recently used for pruning
+            except Exception as e:
+                self.logger.warning(f"Ignoring unreadable speaker latent cache file {cache_file.name}: {e}")
+                latents = None
+
+        if latents is None:
+            latents = tuple(model.get_conditioning_latents(audio_path=[str(wav_path)]))
+            try:
+                cache_dir.mkdir(parents=True, exist_ok=True)
+                torch.save(latents, cache_file)
+                self._prune_latent_cache(cache_dir)
+            except Exception as e:
+                self.logger.warning(f"Could not persist speaker latents for {wav_path.name}: {e}")
+
+        memory_cache[key] = latents
+        return latents
+
+    def _prune_latent_cache(self, cache_dir: Path):
+        """Delete least recently used latent files once the cache grows past LATENT_CACHE_MAX_BYTES."""
+        entries = []
+        for f in cache_dir.glob("*.pt"):
+            st = f.stat()
+            entries.append((st.st_mtime, st.st_size, f))
+        total = sum(size for _, size, _ in entries)
+        for _, size, f in sorted(entries):
+            if total <= LATENT_CACHE_MAX_BYTES:
+                break
+            try:
+                f.unlink()
+                total -= size
+            except OSError:
+                pass
+
+    def _latent_tts_to_file(self, text: str, file_path: str, speaker_wav_path, language: str):
+        """Synthesize a cloned voice from cached speaker latents and write the result as a WAV file."""
+        from TTS.utils.audio.numpy_transforms import save_wav
+
+        model = self._xtts_model()
+        gpt_cond_latent, speaker_embedding = self._speaker_latents(speaker_wav_path)
+        outputs = model.inference(text, language, gpt_cond_latent, speaker_embedding, enable_text_splitting=True)
+        save_wav(wav=outputs['wav'], path=file_path, sample_rate=model.config.audio.output_sample_rate)
+
     def tts_to_file(self, text: str, file_path: str, **kwargs):
         if not self.engine:
             raise RuntimeError("Coqui XTTS engine not initialized.")
@@ -162,47 +531,55 @@ class CoquiXTTS(TTSEngine):
         if 'language' in kwargs:
             coqui_kwargs['language'] = kwargs['language']
         try:
-            self.engine.tts_to_file(text=text, file_path=file_path, **coqui_kwargs)
+            with torch.inference_mode(), self._autocast():
+                if 'speaker_wav' in coqui_kwargs:
+                    self._latent_tts_to_file(text, file_path, kwargs['speaker_wav_path'], coqui_kwargs.get('language', 'en'))
+                elif getattr(self, '_direct_xtts', False):
+                    self._direct_tts_to_file(text, file_path, coqui_kwargs)
+                else:
+                    self.engine.tts_to_file(text=text, file_path=file_path, **coqui_kwargs)
         except Exception as e:
             self.logger.error(f"Coqui XTTS - error during TTS generation: {e}")
             raise
 
     def _find_trainer_module(self) -> str | None:
-        """Return a trainer module to invoke (e.g., 'TTS.bin.train_tts') or None if not found."""
-        import importlib, pkgutil
+        """Return a trainer module to invoke (e.g., 'TTS.bin.train_tts') or None if not found.
+
+        The lookup is in-process only and its result is cached on the instance.
+        """
+        if getattr(self, '_trainer_module_probed', False):
+            return getattr(self, '_trainer_module', None)
+
+        import pkgutil
+        found = None
         # Common candidates
         candidates = [
             'TTS.bin.train',
             'TTS.bin.train_tts',
             'TTS.bin.train_encoder',
             'TTS.bin.train_vocoder',
-            'TTS.bin.train_tts'
         ]
         for c in candidates:
             try:
                 if importlib.util.find_spec(c) is not None:
-                    return c
+                    found = c
+                    break
             except Exception:
                 continue
         # Fallback: scan installed TTS package for any 'train' submodule
-        try:
-            import TTS
-            for mod in pkgutil.walk_packages(TTS.__path__, prefix='TTS.bin.'):
-                if 'train' in mod.name:
-                    return mod.name
-        except Exception:
-            pass
-        # Last-resort: try invoking a few likely -m names and see if python accepts them
-        import subprocess, sys
-        for c in ['TTS.bin.train', 'TTS.bin.train_tts']:
+        if found is None:
             try:
-                proc = subprocess.Popen([sys.executable, '-m', c, '--help'], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-                proc.wait(timeout=5)
-                if proc.returncode in (0, 1):
-                    return c
+                import TTS
+                for mod in pkgutil.walk_packages(TTS.__path__, prefix='TTS.bin.'):
+                    if 'train' in mod.name:
+                        found = mod.name
+                        break
             except Exception:
-                continue
-        return None
+                pass
+
+        self._trainer_module = found
+        self._trainer_module_probed = True
+        return found
 
     def is_trainer_available(self) -> bool:
         """Return True if a Coqui TTS trainer module is available to invoke."""
@@ -221,80 +598,9 @@ class CoquiXTTS(TTSEngine):
         """
         if not line or not line.strip():
             return None
-        parsed: dict = {'raw': line}
-        l = line.strip()
-
-        # Common epoch format: "Epoch: 1/100" or "Epoch 1/100"
-        m = re.search(r'[Ee]poch[: ]*\s*(\d+)\s*/\s*(\d+)', l)
-        if m:
-            try:
-                parsed['epoch'] = int(m.group(1))
-                parsed['epoch_total'] = int(m.group(2))
-            except Exception:
-                pass
-
-        # Step/iteration progress: 'Step: 10/100' or [10/100]
-        m = re.search(r'[Ss]tep[: ]*\s*(\d+)\s*/\s*(\d+)', l)
-        if m:
-            try:
-                parsed['step'] = int(m.group(1))
-                parsed['step_total'] = int(m.group(2))
-                try:
-                    parsed['percent'] = (parsed['step'] / parsed['step_total']) * 100.0
-                except Exception:
-                    pass
-            except Exception:
-                pass
-        else:
-            m = re.search(r'\[(\d+)\s*/\s*(\d+)(?:[^\]]*)\]', l)
-            if m:
-                try:
-                    parsed['step'] = int(m.group(1))
-                    parsed['step_total'] = int(m.group(2))
-                    try:
-                        parsed['percent'] = (parsed['step'] / parsed['step_total']) * 100.0
-                    except Exception:
-                        pass
-                except Exception:
-                    pass
-
-        # Percent explicit like '12%'
-        m = re.search(r'(\d{1,3})\s*%', l)
-        if m:
-            try:
-                parsed['percent'] = float(m.group(1))
-            except Exception:
-                pass
-
-        # Loss field like 'loss: 0.1234' or 'Loss=0.1234'
-        m = re.search(r'loss[:=]\s*([0-9]*\.?[0-9]+)', l, re.I)
-        if m:
-            try:
-                parsed['loss'] = float(m.group(1))
-            except Exception:
-                parsed['loss'] = m.group(1)
-
-        # ETA patterns: 'ETA: 00:20' or progressbar-like '<00:20,'
-        m = re.search(r'ETA[:=]?\s*([0-9hms:]+)', l, re.I)
-        if m:
-            parsed['eta'] = m.group(1)
-        else:
-            m = re.search(r'<\s*([0-9:]+)\s*,', l)
-            if m:
-                parsed['eta'] = m.group(1)
-
-        # If we only have epoch/epoch_total, compute coarse percent
-        if 'percent' not in parsed and 'epoch' in parsed and 'epoch_total' in parsed:
-            try:
-                parsed['percent'] = (parsed['epoch'] / parsed['epoch_total']) * 100.0
-            except Exception:
-                pass
-
-        # If no meaningful keys other than raw, return None
-        keys = set(parsed.keys()) - {'raw'}
-        if not keys:
-            return None
-        return parsed
+        parsed = _parse_trainer_line(line)
+        # Results are memoized, so hand out a copy callers are free to mutate
+        return dict(parsed) if parsed else None
 
     def create_refined_model(self, training_wav_paths: list, model_name: str, metadata_csv_path: str | None = None, training_params: dict | None = None, log_window=None) -> bool:
         """
@@ -331,24 +637,30 @@ class CoquiXTTS(TTSEngine):
             # Copy wavs into 'wavs' subdir and create metadata.csv compatible with Coqui format (wav_filename|text)
             wavs_dir = target_dir / "wavs"
             wavs_dir.mkdir()
-            for wav in wav_paths:
-                shutil.copy2(wav, wavs_dir / wav.name)
+            # I/O bound, so a small thread pool overlaps the per-file filesystem calls
+            with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as pool:
+                list(pool.map(lambda wav: _ingest_wav(wav, wavs_dir / wav.name), wav_paths))
             self.logger.info(f"Copied {len(wav_paths)} training files to {wavs_dir}")
 
             # Normalize metadata.csv: ensure file references the copied filenames (basename only)
             metadata_in = Path(metadata_csv_path)
             metadata_out = target_dir / "metadata.csv"
             try:
-                with metadata_in.open('r', encoding='utf-8') as fin, metadata_out.open('w', encoding='utf-8') as fout:
+                # Pure bytes slicing (UTF-8 passes through untouched) with large buffers; this
+                # loop runs once per clip and datasets can have 100k+ lines.
+                with metadata_in.open('rb', buffering=METADATA_IO_BUFFER) as fin, metadata_out.open('wb', buffering=METADATA_IO_BUFFER) as fout:
                     for line in fin:
-                        if not line.strip():
-                            continue
-                        parts = line.strip().split('|', 1)
-                        if not parts:
+                        line = line.strip()
+                        if not line:
                             continue
-                        fname = Path(parts[0]).name
-                        transcript = parts[1].strip() if len(parts) > 1 else ""
-                        fout.write(f"{fname}|{transcript}\n")
+                        pipe_idx = line.find(b'|')
+                        if pipe_idx < 0:
+                            pipe_idx = len(line)
+                        # Basename of the wav reference; accept both POSIX and Windows separators
+                        sep_idx = max(line.rfind(b'/', 0, pipe_idx), line.rfind(b'\\', 0, pipe_idx))
+                        fname = line[sep_idx + 1:pipe_idx].strip()
+                        transcript = line[pipe_idx + 1:].strip()
+                        fout.write(b''.join((fname, b'|', transcript, b'\n')))
                 self.logger.info(f"Written metadata.csv to {metadata_out}")
             except Exception as e:
                 self.logger.error(f"Failed to copy/normalize metadata CSV: {e}")
@@ -418,41 +730,120 @@ class CoquiXTTS(TTSEngine):
                     train_cmd = [python_exe, '-m', trainer_mod, '--config_path', str(config_path)]
 
                     self.logger.info(f"Running training command: {' '.join(train_cmd)}")
-                    proc = subprocess.Popen(train_cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+                    # Raw bytes: the reader splits on \n/\r itself and decoding happens on the consumer side
+                    proc = subprocess.Popen(train_cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=0)
 
-                    # Stream output to logger and UI
-                    for line in proc.stdout:
-                        line = line.rstrip('\n')
-                        self.logger.info(f"[TTS TRAIN] {line}")
-                        # Send to UI queue for general status
+                    # A dedicated reader drains the pipe so a slow UI/log window can never
+                    # fill it and block the trainer on write. Oldest lines are dropped if the
+                    # consumer falls far behind; None marks end of output.
+                    line_queue = queue.Queue(maxsize=TRAINER_LINE_QUEUE_SIZE)
+
+                    def _put_drop_oldest(item):
+                        while True:
+                            try:
+                                line_queue.put_nowait(item)
+                                return
+                            except queue.Full:
+                                try:
+                                    line_queue.get_nowait()
+                                except queue.Empty:
+                                    pass
+
+                    def _pump_stdout():
+                        fd = proc.stdout.fileno()
+                        pending = bytearray()
                         try:
-                            self.ui.update_queue.put({'status': line})
-                        except Exception:
+                            while True:
+                                chunk = os.read(fd, TRAINER_READ_CHUNK)
+                                if not chunk:
+                                    break
+                                pending += chunk
+                                # Only the new bytes are scanned; the buffer is split once something completes
+                                if b'\n' not in chunk and b'\r' not in chunk:
+                                    continue
+                                lines = bytes(pending).split(b'\n')
+                                tail = lines.pop()
+                                for raw_line in lines:
+                                    # tqdm redraws with \r; only the final refresh of a line matters
+                                    piece = raw_line.rstrip(b'\r').rsplit(b'\r', 1)[-1]
+                                    if piece:
+                                        _put_drop_oldest(piece)
+                                if b'\r' in tail:
+                                    # Emit the latest complete progress-bar refresh without waiting for \n
+                                    head, tail = tail.rsplit(b'\r', 1)
+                                    piece = head.rsplit(b'\r', 1)[-1]
+                                    if piece:
+                                        _put_drop_oldest(piece)
+                                pending = bytearray(tail)
+                            if pending:
+                                _put_drop_oldest(bytes(pending))
+                        except OSError:
                             pass
+                        finally:
+                            _put_drop_oldest(None)
 
-                        # Parse trainer output for progress info and send structured updates
-                        try:
-                            parsed = self._parse_trainer_output(line)
-                            if parsed:
+                    threading.Thread(target=_pump_stdout, daemon=True).start()
+
+                    # Stream output to logger and UI. UI hand-offs are coalesced: at most one
+                    # queue message and one log-window insert per TRAINER_UI_FLUSH_INTERVAL.
+                    pending_lines: list[str] = []
+                    latest_progress: dict = {}
+                    last_flush = time.monotonic()
+
+                    def _flush():
+                        if latest_progress:
+                            try:
+                                self.ui.update_queue.put({'training_progress': dict(latest_progress)})
+                            except Exception:
+                                pass
+                            if log_window and hasattr(log_window, 'update_progress'):
                                 try:
-                                    self.ui.update_queue.put({'training_progress': parsed})
+                                    log_window.update_progress(dict(latest_progress))
                                 except Exception:
                                     pass
-                                if log_window and hasattr(log_window, 'update_progress'):
-                                    try:
-                                        log_window.update_progress(parsed)
-                                    except Exception:
-                                        pass
-                        except Exception:
-                            # Parsing must not interrupt the training loop
-                            self.logger.debug("Trainer output parsing failed for line: " + line)
-
-                        # Also append the raw line to the live log window if provided
+                        elif pending_lines:
+                            try:
+                                self.ui.update_queue.put({'status': pending_lines[-1]})
+                            except Exception:
+                                pass
+                        if pending_lines and log_window:
+                            try:
+                                if hasattr(log_window, 'append_lines'):
+                                    log_window.append_lines(list(pending_lines))
+                                elif hasattr(log_window, 'append_line'):
+                                    for pending in pending_lines:
+                                        log_window.append_line(pending)
+                            except Exception:
+                                pass
+                        pending_lines.clear()
+                        latest_progress.clear()
+
+                    while True:
                         try:
-                            if log_window and hasattr(log_window, 'append_line'):
-                                log_window.append_line(line)
-                        except Exception:
-                            pass
+                            raw_line = line_queue.get(timeout=TRAINER_UI_FLUSH_INTERVAL)
+                        except queue.Empty:
+                            raw_line = b''  # No new output; still give pending updates a chance to flush
+                        if raw_line is None:
+                            break
+                        if raw_line:
+                            line = raw_line.decode('utf-8', 'replace')
+                            self.logger.info(f"[TTS TRAIN] {line}")
+                            pending_lines.append(line)
+
+                            # Parse trainer output for progress info; newer fields overwrite older ones
+                            try:
+                                parsed = self._parse_trainer_output(line)
+                                if parsed:
+                                    latest_progress.update(parsed)
+                            except Exception:
+                                # Parsing must not interrupt the training loop
+                                self.logger.debug("Trainer output parsing failed for line: " + line)
+
+                        now = time.monotonic()
+                        if now - last_flush >= TRAINER_UI_FLUSH_INTERVAL:
+                            _flush()
+                            last_flush = now
+                    _flush()
 
                     proc.wait()
                     if proc.returncode == 0:
@@ -521,7 +912,15 @@ class ChatterboxTTS(TTSEngine):
                     self.logger.warning(f"RADIOSHOW_TTS_DEVICE is set to '{device_pref}', but CUDA is unavailable. Falling back to CPU.")
                     device = 'cpu'
 
+            if device == 'cpu':
+                _limit_cpu_threads(self.logger)
             self.engine = ChatterboxTTSModule.from_pretrained(device=device)
+            self._freeze_chatterbox()
+            self._autocast_dtype = None
+            if str(self.engine.device).startswith('cuda'):
+                self._configure_cuda_precision()
+                if _compile_requested() and self._compile_submodules(self.engine, ('t3', 's3gen')):
+                    self._warmup()
             self.logger.info(f"Chatterbox engine initialized successfully on device: {self.engine.device}.")
             self.ui.update_queue.put({'status': f"Chatterbox engine initialized on device: {self.engine.device}."})
             return True
@@ -535,7 +934,10 @@ class ChatterboxTTS(TTSEngine):
                     try:
                         self.logger.warning("Chatterbox initialization hit paging/memory limits on GPU; retrying on CPU.")
                         self.ui.update_queue.put({'status': "Chatterbox hit a Windows paging/memory limit on GPU. Retrying on CPU..."})
+                        _limit_cpu_threads(self.logger)
                         self.engine = ChatterboxTTSModule.from_pretrained(device='cpu')
+                        self._freeze_chatterbox()
+                        self._autocast_dtype = None
                         self.logger.info(f"Chatterbox engine initialized successfully on fallback device: {self.engine.device}.")
                         self.ui.update_queue.put({'status': f"Chatterbox initialized on fallback device: {self.engine.device}."})
                         return True
@@ -559,7 +961,13 @@ class ChatterboxTTS(TTSEngine):
             self.ui.update_queue.put({'error': f"Could not initialize Chatterbox.\n\nDETAILS:\n{detailed_error}"})
             return False
 
+    def _freeze_chatterbox(self):
+        """Chatterbox is a plain container of torch modules (t3, s3gen, ve); freeze each one."""
+        self._freeze_for_inference([getattr(self.engine, name, None) for name in ('t3', 's3gen', 've')])
+
     def tts_to_file(self, text: str, file_path: str, **kwargs):
+        """Synthesize to file. With defer_write=True the WAV is written on a background thread
+        so the next line can start generating; call flush() before reading those files."""
         if not self.engine:
             raise RuntimeError("Chatterbox engine not initialized.")
         chatterbox_gen_kwargs = {}
@@ -568,12 +976,65 @@ class ChatterboxTTS(TTSEngine):
             chatterbox_gen_kwargs['audio_prompt_path'] = str(wav_path)
         
         try:
-            wav = self.engine.generate(text, **chatterbox_gen_kwargs)
+            with torch.inference_mode(), self._autocast():
+                wav = self.engine.generate(text, **chatterbox_gen_kwargs)
             safe_file_path = Path(file_path).resolve()
-            torchaudio.save(str(safe_file_path), wav, self.engine.sr)
+            if not kwargs.get('defer_write'):
+                # torchaudio.save expects float32 samples
+                torchaudio.save(str(safe_file_path), wav.float(), self.engine.sr)
+                return
+
+            ready_event = None
+            if wav.is_cuda:
+                # Copy into pinned host memory without blocking the stream; the writer waits on the event.
+                # Pinned allocations are served from torch's caching host allocator, and a fresh buffer
+                # per clip avoids overwriting audio that is still queued for writing.
+                host_wav = torch.empty(wav.shape, dtype=torch.float32, pin_memory=True)
+                host_wav.copy_(wav, non_blocking=True)
+                ready_event = torch.cuda.Event()
+                ready_event.record()
+            else:
+                host_wav = wav.float()
+            self._submit_write(safe_file_path, host_wav, ready_event)
         except Exception as e:
             self.logger.error(f"Chatterbox - error during TTS generation or saving file: {e}")
             raise
 
+    def _submit_write(self, file_path: Path, host_wav, ready_event):
+        executor = getattr(self, '_write_executor', None)
+        if executor is None:
+            executor = self._write_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="chatterbox-writer")
+            self._pending_writes = []
+            self._failed_writes = []
+
+        def _write():
+            if ready_event is not None:
+                ready_event.synchronize()
+            torchaudio.save(str(file_path), host_wav, self.engine.sr)
+
+        self._pending_writes.append((file_path, executor.submit(_write)))
+        # Bound host memory held by queued clips
+        while len(self._pending_writes) > MAX_PENDING_WRITES:
+            self._wait_for_write(*self._pending_writes.pop(0))
+
+    def _wait_for_write(self, file_path: Path, future) -> bool:
+        """Wait for one queued write; failures are recorded so flush() can report them."""
+        try:
+            future.result()
+            return True
+        except Exception as e:
+            self.logger.error(f"Chatterbox - failed to write audio file {file_path.name}: {e}")
+            self._failed_writes.append(file_path)
+            return False
+
+    def flush(self) -> list:
+        """Wait for every deferred write and return the paths that failed since the last flush."""
+        pending = getattr(self, '_pending_writes', None) or []
+        while pending:
+            self._wait_for_write(*pending.pop(0))
+        failed = getattr(self, '_failed_writes', None) or []
+        self._failed_writes = []
+        return failed
+
     def get_engine_specific_voices(self) -> list:
         return [{'name': "Chatterbox Default", 'id_or_path': 'chatterbox_default_internal', 'type': 'internal'}]
\ No newline at end of file
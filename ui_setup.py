@@ -3,8 +3,8 @@ import tkinter as tk
 from tkinter import ttk, simpledialog, filedialog, messagebox, scrolledtext
 from pathlib import Path
 import threading
+import collections
 import re
-import queue
 import textwrap
 import shutil # For copying files
 import os # For opening directory
@@ -13,17 +13,24 @@ import subprocess # For opening directory on macOS/Linux
 import wave
 from difflib import SequenceMatcher
 try:
-    from tkinterdnd2 import DND_FILES, TkinterDnD
+    from tkinterdnd2 import DND_FILES # main_app already imported tkinterdnd2 to build the root
 except Exception:
     DND_FILES = None
-    TkinterDnD = None
 import platform # For system detection
 import json # For saving/loading voice config
+import sys
+import time
+try:
+    import orjson # Optional faster JSON for the voice config and project files
+except ImportError:
+    orjson = None
 import importlib.util
+import functools
+from bisect import insort
+import colorsys
 from app_state import AppState, PostAction, VoicingMode
 import tkinter.font as tkfont
 
-from pydub.playback import play as pydub_play
 from pydub import AudioSegment
 # Import the logic class from the other file
 from dialogs import AddVoiceDialog, ConfirmationDialog, PreflightDialog, VoiceSelectionDialog # Import new dialogs
@@ -35,6 +42,143 @@ from views.cast_refinement_view import CastRefinementView
 from views.voice_assignment_view import VoiceAssignmentView
 from views.review_view import ReviewView # Import the new ReviewView
 
+# Long table fills (step 4 analysis, review): rows inserted synchronously, then rows per event-loop batch.
+STEP4_INITIAL_ROWS = 300
+STEP4_ROW_BATCH = 500
+
+# check_update_queue handles at most this many updates per tick, then yields to Tk before continuing.
+UPDATE_QUEUE_BATCH_LIMIT = 50
+
+# Workers wake check_update_queue through this virtual event; the slow poll below is only a safety net
+# (dead-thread detection, and Tcl builds that refuse calls from other threads).
+UPDATE_QUEUE_EVENT = '<<UpdateQueue>>'
+UPDATE_QUEUE_FALLBACK_POLL_MS = 1000
+# Wakeups sooner than this after the previous drain wait for the rest of the interval, so a fast progress
+# stream is drained (and its coalesced status/progress repainted) at most ~20 times a second
+UPDATE_QUEUE_MIN_INTERVAL_MS = 50
+
+# Worker messages that only repaint the status label / progress bar. Within one queue batch only
+# the last message of each kind is visible, so earlier ones are skipped: kind -> (marker key, allowed keys).
+_COALESCED_UPDATE_KINDS = (
+    ('status', 'status', frozenset({'status', 'level'})),
+    ('assembly', 'assembly_progress', frozenset({'assembly_progress'})),
+    ('generation', 'is_generation', frozenset({'progress', 'is_generation'})),
+    ('bulk_regeneration', 'is_bulk_regeneration', frozenset({'progress', 'is_bulk_regeneration', 'bulk_total'})),
+    ('asr_validation', 'asr_validation_progress', frozenset({'asr_validation_progress', 'asr_validation_total'})),
+)
+
+def _coalesce_kind(update):
+    """Kind name if `update` is a pure status/progress repaint that a later one supersedes, else None."""
+    for kind, marker, allowed_keys in _COALESCED_UPDATE_KINDS:
+        # Falsy markers (e.g. the first ASR progress of 0) are routed elsewhere; never drop those
+        if update.get(marker) and update.keys() <= allowed_keys:
+            return kind
+    return None
+
+def _is_speaker_resolution_update(update):
+    """True for an LLM pass-2 message resolving one analysis row's speaker."""
+    return 'progress' in update and 'original_index' in update and 'new_speaker' in update
+
+# TTS engines the app can drive, and the module whose presence means the engine is installed
+TTS_ENGINE_SPECS = (
+    {"label": "Coqui XTTS", "value": "Coqui XTTS", "check_module": "TTS.api"},
+    {"label": "Chatterbox", "value": "Chatterbox", "check_module": "chatterbox.tts"},
+)
+
+@functools.lru_cache(maxsize=None)
+def _generated_speaker_color(index):
+    """Color for the speaker at `index` in appearance order once the fixed palette is used up."""
+    hue = (index * 137.508) % 360  # Golden angle for good distribution
+    saturation = 0.7 + (index % 3) * 0.1  # Vary saturation
+    value = 0.8 + (index % 2) * 0.2  # Vary brightness
+    rgb = colorsys.hsv_to_rgb(hue/360, saturation, value)
+    return f"#{int(rgb[0]*255):02x}{int(rgb[1]*255):02x}{int(rgb[2]*255):02x}"
+
+@functools.lru_cache(maxsize=None)
+def _engine_module_available(module_name):
+    """Whether an engine's check module can be imported, without importing it (cached for the session)."""
+    if module_name in sys.modules:
+        return True
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        # ImportError: parent package missing (find_spec('a.b') raises when 'a' is absent);
+        # ValueError: PIL stub issue in tests
+        return False
+
+# Editor text is read on a worker thread and inserted in chunks of this many characters.
+EDITOR_LOAD_CHUNK_CHARS = 64 * 1024
+
+# Voice edits schedule one voices_config.json write this long after the first change.
+VOICE_CONFIG_SAVE_DELAY_MS = 500
+
+# Theme radio buttons: only the last click within this window re-themes the UI.
+THEME_APPLY_DEBOUNCE_MS = 80
+
+def _dump_json_bytes(data):
+    """Serialize to indented UTF-8 JSON bytes, with orjson when it is installed."""
+    if orjson is not None:
+        try:
+            # OPT_NON_STR_KEYS matches the stdlib's str() coercion of int keys
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
+        except TypeError: # orjson.JSONEncodeError; retry with the more permissive stdlib encoder
+            pass
+    return (json.dumps(data, indent=2, ensure_ascii=False) + '\n').encode('utf-8') # Same layout as the orjson path
+
+def _load_json_bytes(payload):
+    """Parse UTF-8 JSON bytes, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+# Speaker labels left over when analysis could not attribute a line; these fall back to the narrator voice.
+_UNRESOLVED_SPEAKERS = frozenset({'AMBIGUOUS', 'UNKNOWN', 'TIMED_OUT'})
+_NARRATOR_OR_UNRESOLVED = _UNRESOLVED_SPEAKERS | {'NARRATOR'}
+
+# show_status_message type -> (theme color key, fallback color)
+_STATUS_MESSAGE_COLORS = {
+    "success": ("success_fg", "green"),
+    "error": ("error_fg", "red"),
+    "warning": ("error_fg", "red"),
+}
+
+# Progress timer label texts for the first minute, which covers most waits; later ones are formatted on demand.
+_TIMER_TEXTS = tuple(f"Working... Please wait. ({s}s elapsed)" for s in range(60))
+
+# sanitize_for_tts patterns, compiled once since it runs for every line sent to the TTS engine
+_RE_TTS_BRACKETS = re.compile(r'\[.*?\]')
+_RE_TTS_PARENS = re.compile(r'\(.*\)')
+# Single characters dropped in one str.translate pass: asterisks and quote characters
+_TTS_STRIP_CHARS = str.maketrans('', '', '*“”‘’"\\')
+_RE_TTS_ELLIPSIS = re.compile(r'\.{3,}')
+_RE_TTS_DOUBLE_DASH = re.compile(r'\s*--\s*')
+_RE_TTS_WHITESPACE = re.compile(r'\s+')
+_RE_TTS_WORDS = re.compile(r"[A-Za-z']+")
+_RE_TTS_NON_ALNUM = re.compile(r'[^A-Za-z0-9]')
+_RE_TTS_END_PUNCT = re.compile(r'[.!?]$')
+
+class UpdateQueue(collections.deque):
+    """Worker -> UI message queue. Workers only append and the Tk loop only pops, and deque
+    append/popleft are atomic, so this skips queue.Queue's lock and condition per message.
+    `put` keeps the queue.Queue producer interface used throughout the workers.
+
+    `wakeup` is called on the first put after the consumer last called `begin_drain`, so a burst
+    of messages costs one wakeup rather than one per message."""
+    def __init__(self, wakeup=None):
+        super().__init__()
+        self._wakeup = wakeup
+        self._wakeup_pending = False
+
+    def put(self, update):
+        self.append(update)
+        if self._wakeup is not None and not self._wakeup_pending:
+            self._wakeup_pending = True
+            self._wakeup()
+
+    def begin_drain(self):
+        """Called by the consumer before popping, so anything put afterwards triggers a new wakeup."""
+        self._wakeup_pending = False
+
 class RadioShowApp(tk.Frame):
     def __init__(self, root):
         # Ensure minimal tk attributes exist on the test stub root to avoid AttributeError in headless tests
@@ -70,6 +214,14 @@ class RadioShowApp(tk.Frame):
             root.protocol = lambda *args, **kwargs: None
         if not hasattr(root, 'after'):
             root.after = lambda *args, **kwargs: None
+        if not hasattr(root, 'after_idle'):
+            root.after_idle = lambda *args, **kwargs: None
+        if not hasattr(root, 'after_cancel'):
+            root.after_cancel = lambda *args, **kwargs: None
+        if not hasattr(root, 'bind'):
+            root.bind = lambda *args, **kwargs: None
+        if not hasattr(root, 'event_generate'):
+            root.event_generate = lambda *args, **kwargs: None
         if not hasattr(root, 'winfo_screenwidth'):
             root.winfo_screenwidth = lambda: 1920
         if not hasattr(root, 'winfo_screenheight'):
@@ -88,25 +240,30 @@ class RadioShowApp(tk.Frame):
         self.root = root
         self.pack(fill=tk.BOTH, expand=True)
 
-        # Initialize lists for themed widgets as instance attributes
-        self._themed_tk_labels = []
-        self._themed_tk_buttons = []
-        self._themed_tk_frames = []
-        self._themed_tk_labelframes = []
+        # Per-instance weak registries of widgets to re-theme (views append/extend into these)
+        self._themed_tk_labels = theming.ThemedWidgetSet()
+        self._themed_tk_buttons = theming.ThemedWidgetSet()
+        self._themed_tk_frames = theming.ThemedWidgetSet()
+        self._themed_tk_labelframes = theming.ThemedWidgetSet()
+        self._themed_tk_checkbuttons = theming.ThemedWidgetSet()
 
         # Centralized application state
         self.state = AppState()
 
-        self.allowed_extensions = ['.epub', '.mobi', '.pdf', '.azw3']
+        self.allowed_extensions = frozenset({'.epub', '.mobi', '.pdf', '.azw3'}) # Compared against suffix.lower()
         self.timer_id = None
         self.timer_seconds = 0
-        self.update_queue = queue.Queue()
-        self.state.output_dir.mkdir(exist_ok=True)
-        (self.state.output_dir / "voices").mkdir(exist_ok=True) # Ensure voices subdirectory exists
-
-        # Application configuration manager (persistent settings)
-        from config_manager import ConfigManager
-        self.config_manager = ConfigManager(self.state.output_dir / 'app_config.json')
+        self._timer_started_at = 0.0
+        self.update_queue = UpdateQueue(wakeup=self._signal_update_queue)
+        self._update_queue_poll_id = None
+        self._update_queue_drained_at = 0.0 # time.monotonic() of the last check_update_queue
+        self._cast_tree_rows = {} # Tk path of each cast tree -> rows it was last populated with
+        self._speaker_tag_colors = {} # Speaker tag -> color get_speaker_color_tag last defined it with
+        # Creates output_dir too; it must exist before AppLogic opens its log file there
+        (self.state.output_dir / "voices").mkdir(parents=True, exist_ok=True)
+
+        # Application configuration manager (persistent settings), read on first use via the config_manager property
+        self._config_manager = None
 
         # Helper utilities for remembering last-used folders per dialog
         def _get_last_dir_local(key: str, fallback: Path | None = None):
@@ -135,6 +292,18 @@ class RadioShowApp(tk.Frame):
         self.current_theme_name = "system" # "light", "dark", "system"
         self.system_actual_theme = "light" # What "system" resolves to
         self._theme_colors = {}
+        self._system_theme_watched = False # True while the Windows theme watcher thread runs
+        self._theme_apply_after_id = None # Pending debounced schedule_theme_apply re-apply
+        self._theme_stale_frames = set() # Hidden main view frames that missed the last theme switch
+        self._theme_widget_owners = {} # Themed widget -> main view frame holding it (see theming._owning_view_frame)
+        self._current_view_frame = None # Main view frame shown by _show_main_frame
+        self._editor_load_token = 0 # Bumped to invalidate an in-flight editor text load
+        self._editor_loading_txt_path = None
+        self._editor_loaded_txt_path = None # txt_path whose text the editor currently holds
+        self._voice_config_save_after_id = None # Pending debounced save_voice_config write
+        self._toggleable_widgets = None # Built by set_ui_state on first use
+        self._root_cursor = "" # Cursor set_ui_state last gave the root window
+        self._speaker_cell_editor = None # Combobox open over a Step 4 speaker cell
         self.theme_var = tk.StringVar(master=self.root, value=self.current_theme_name) # "light", "dark", "system"
         self.selected_tts_engine_name = "Coqui XTTS" # Default, will be updated by tts_engine_var
         self.tts_engine_var = tk.StringVar(master=self.root, value="Coqui XTTS") # Default TTS engine
@@ -146,6 +315,8 @@ class RadioShowApp(tk.Frame):
         self._step4_flagged_positions = []
         self._step4_flagged_cursor = -1
         self._review_visible_rows = []
+        self._review_fill_token = 0 # Bumped to cancel an unfinished review table fill
+        self._review_max_line_count = 1
 
         # High contrast, distinguishable colors for speakers
         self.color_palette = [
@@ -161,7 +332,8 @@ class RadioShowApp(tk.Frame):
 
         # Bind the closing event to a cleanup method
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
-        self.load_voice_config() # Load saved voices before UI creation that depends on it
+        # Read saved voices off the UI thread; the dropdown is refreshed when 'voices_loaded' arrives
+        threading.Thread(target=self._load_voice_config_worker, daemon=True).start()
 
         # UI Frames and Widgets
         self.content_frame = tk.Frame(self)
@@ -183,6 +355,14 @@ class RadioShowApp(tk.Frame):
         self.voice_assignment_view = VoiceAssignmentView(self.voice_assignment_frame, self)
         self.review_frame = tk.Frame(self.content_frame) 
         self.review_view = ReviewView(self.review_frame, self)
+        # All main views share one grid cell; switching views is a grid_remove() and a grid(), and
+        # removed views drop out of focus traversal so their buttons can't be reached with Tab
+        self.content_frame.grid_rowconfigure(0, weight=1)
+        self.content_frame.grid_columnconfigure(0, weight=1)
+        for view_frame in (self.wizard_frame, self.editor_frame, self.cast_refinement_frame,
+                           self.voice_assignment_frame, self.review_frame):
+            view_frame.grid(row=0, column=0, sticky='nsew')
+            view_frame.grid_remove()
         if not FASTER_WHISPER_AVAILABLE and hasattr(self.review_view, 'asr_validation_button'):
             self.review_view.asr_validation_button.config(
                 state=tk.DISABLED,
@@ -244,10 +424,12 @@ class RadioShowApp(tk.Frame):
         self.show_wizard_view()
 
         # Start the main UI update loop to keep the app responsive
+        self.root.bind(UPDATE_QUEUE_EVENT, self._on_update_queue_event, add='+')
         self.check_update_queue()
 
         # Add a method to handle the window closing event
     def on_closing(self):
+        self._flush_pending_voice_config_save()
         self.logic.on_app_closing() # Call logic cleanup
         self.root.destroy() # Destroy the window
     
@@ -278,20 +460,12 @@ class RadioShowApp(tk.Frame):
         self.tts_engine_menu = tk.Menu(self.menubar, tearoff=0)
         self.menubar.add_cascade(label="TTS Engine", menu=self.tts_engine_menu)
 
-        possible_engines = [
-            {"label": "Coqui XTTS", "value": "Coqui XTTS", "check_module": "TTS.api"},
-            {"label": "Chatterbox", "value": "Chatterbox", "check_module": "chatterbox.tts"}
-        ]
-
         available_engines = []
-        for engine_spec in possible_engines:
-            try:
-                if importlib.util.find_spec(engine_spec["check_module"]) is None:
-                    raise ImportError(engine_spec["check_module"])
+        for engine_spec in TTS_ENGINE_SPECS:
+            if _engine_module_available(engine_spec["check_module"]):
                 available_engines.append(engine_spec)
                 self.logic.logger.info(f"TTS Engine available: {engine_spec['label']}")
-            except (ImportError, ValueError):
-                # ImportError: module not found; ValueError: PIL stub issue in tests
+            else:
                 self.logic.logger.info(f"TTS Engine {engine_spec['label']} (module {engine_spec['check_module']}) not found. It will not be listed.")
 
         if available_engines:
@@ -329,9 +503,22 @@ class RadioShowApp(tk.Frame):
         self.state.voicing_mode = VoicingMode(selected_mode_str)
         self.logic.logger.info(f"Voicing mode changed to: {self.state.voicing_mode}")
 
-    def _wrap_tree_cell_text(self, tree_widget, column_name, text):
+    def _wrap_tree_cell_text(self, tree_widget, column_name, text, wrap_chars=None):
         """Wrap tree cell text based on current column width and return wrapped text plus line count."""
         raw_text = "" if text is None else str(text)
+        if wrap_chars is None:
+            wrap_chars = self._tree_wrap_chars(tree_widget, column_name)
+        wrapped_text = textwrap.fill(
+            raw_text,
+            width=wrap_chars,
+            break_long_words=False,
+            break_on_hyphens=False,
+        )
+        line_count = max(1, wrapped_text.count("\n") + 1)
+        return wrapped_text, line_count
+
+    def _tree_wrap_chars(self, tree_widget, column_name):
+        """Characters per wrapped line for a tree column; compute once per refresh, not per row."""
         try:
             width_px = int(tree_widget.column(column_name, 'width'))
         except Exception:
@@ -343,15 +530,26 @@ class RadioShowApp(tk.Frame):
         except Exception:
             avg_char_px = 7.0
 
-        wrap_chars = max(20, int((max(width_px, 120) - 24) / avg_char_px))
-        wrapped_text = textwrap.fill(
-            raw_text,
-            width=wrap_chars,
-            break_long_words=False,
-            break_on_hyphens=False,
-        )
-        line_count = max(1, wrapped_text.count("\n") + 1)
-        return wrapped_text, line_count
+        return max(20, int((max(width_px, 120) - 24) / avg_char_px))
+
+    def _bulk_insert_tree_rows(self, tree_widget, rows):
+        """Append (iid, values, tags) rows at the end of a tree.
+
+        Goes straight to the Tcl `insert` command with prebuilt argument tuples, skipping the
+        per-call option formatting in ttk.Treeview.insert; matters for thousands of rows.
+        The scrollbar callback is detached for the batch and fires once when it is restored.
+        """
+        call = tree_widget.tk.call
+        widget_path = str(tree_widget)
+        yscrollcommand = call(widget_path, 'cget', '-yscrollcommand')
+        if yscrollcommand:
+            call(widget_path, 'configure', '-yscrollcommand', '')
+        try:
+            for iid, values, tags in rows:
+                call(widget_path, 'insert', '', 'end', '-id', iid, '-values', values, '-tags', tags)
+        finally:
+            if yscrollcommand:
+                call(widget_path, 'configure', '-yscrollcommand', yscrollcommand)
 
     def _set_treeview_rowheight(self, tree_widget, required_lines):
         """Apply a per-tree style so wrapped lines are fully visible."""
@@ -373,7 +571,7 @@ class RadioShowApp(tk.Frame):
         confidence = str(item.get('speaker_confidence') or 'medium').lower()
         source = str(item.get('speaker_source') or '')
 
-        if speaker in {'AMBIGUOUS', 'UNKNOWN', 'TIMED_OUT'}:
+        if speaker in _UNRESOLVED_SPEAKERS:
             issues.append('Ambiguous speaker')
         if confidence != 'high':
             issues.append('Low confidence')
@@ -460,6 +658,41 @@ class RadioShowApp(tk.Frame):
 
         return flagged
 
+    def _insert_step4_rows(self, token, rows, start, wrap_chars, batch_size=None):
+        tree = self.cast_refinement_view.tree
+        if token != self._step4_fill_token or not tree:
+            return
+        end = min(len(rows), start + (batch_size or STEP4_ROW_BATCH))
+        max_line_count = self._step4_max_line_count
+        batch = []
+        # Hot loop: bind lookups once. Speaker tags were defined on the tree by _refresh_step4_table,
+        # so each speaker's (tag, stripe) tuples are built once per batch instead of per row.
+        append = batch.append
+        wrap_cell = self._wrap_tree_cell_text
+        speaker_colors = self.state.speaker_colors
+        row_tags_by_speaker = {}
+        for i in range(start, end):
+            row = rows[i]
+            speaker = row['speaker']
+            tag_pair = row_tags_by_speaker.get(speaker)
+            if tag_pair is None:
+                speaker_color_tag = theming.speaker_tag_name(speaker) if speaker in speaker_colors else "default_tag"
+                tag_pair = row_tags_by_speaker[speaker] = ((speaker_color_tag, 'evenrow'), (speaker_color_tag, 'oddrow'))
+            wrapped_line, line_count = wrap_cell(tree, 'line', row['line'], wrap_chars)
+            if line_count > max_line_count: max_line_count = line_count
+            append((
+                f"step4_{row['original_index']}",
+                (speaker, row['confidence'], row['issue'], wrapped_line, row['pov']),
+                tag_pair[i & 1],
+            ))
+        self._bulk_insert_tree_rows(tree, batch)
+
+        if max_line_count != self._step4_max_line_count or start == 0:
+            self._step4_max_line_count = max_line_count
+            self._set_treeview_rowheight(tree, max_line_count)
+        if end < len(rows):
+            self.root.after(1, lambda: self._insert_step4_rows(token, rows, end, wrap_chars))
+
     def _build_step4_display_rows(self):
         quote_damage_indices = self._detect_quote_damage_indices()
         rows = []
@@ -505,6 +738,10 @@ class RadioShowApp(tk.Frame):
                 text=f"Showing {len(self._step4_visible_rows)} of {len(self.state.analysis_result)} lines | {flagged_count} flagged | {current_display}/{flagged_count if flagged_count else 0}"
             )
 
+    def _step4_original_index(self, item_id):
+        """analysis_result index of an analysis-table row (iids are 'step4_<index>')."""
+        return int(item_id[len('step4_'):]) if item_id.startswith('step4_') else None
+
     def _select_step4_flagged_at_cursor(self):
         if not self.cast_refinement_view.tree or not self._step4_flagged_positions:
             return
@@ -537,24 +774,16 @@ class RadioShowApp(tk.Frame):
         all_rows = self._build_step4_display_rows()
         visible_rows = self._filter_step4_display_rows(all_rows)
         self._step4_visible_rows = visible_rows
-        self.cast_refinement_view.tree.delete(*self.cast_refinement_view.tree.get_children())
-
-        max_line_count = 1
-        for i, row in enumerate(visible_rows):
-            speaker_color_tag = self.get_speaker_color_tag(row.get('speaker', 'N/A'))
-            row_tags = (speaker_color_tag, 'evenrow' if i % 2 == 0 else 'oddrow')
-            wrapped_line, line_count = self._wrap_tree_cell_text(self.cast_refinement_view.tree, 'line', row.get('line', 'N/A'))
-            max_line_count = max(max_line_count, line_count)
-            self.cast_refinement_view.tree.insert(
-                '',
-                tk.END,
-                iid=f"step4_{row['original_index']}",
-                values=(row.get('speaker', 'N/A'), row.get('confidence', 'Medium'), row.get('issue', 'OK'), wrapped_line, row.get('pov', 'Unknown')),
-                tags=row_tags
-            )
+        tree = self.cast_refinement_view.tree
+        children = tree.get_children()
+        if children: tree.delete(*children)
+        theming.configure_treeview_tags(self, tree)
 
-        self._set_treeview_rowheight(self.cast_refinement_view.tree, max_line_count)
-        self.update_treeview_item_tags(self.cast_refinement_view.tree)
+        # Long scripts are filled in batches from the event loop so the window stays responsive;
+        # the first screenfuls are inserted immediately. A newer refresh cancels an unfinished fill.
+        self._step4_fill_token = getattr(self, '_step4_fill_token', 0) + 1
+        self._step4_max_line_count = 1
+        self._insert_step4_rows(self._step4_fill_token, visible_rows, 0, self._tree_wrap_chars(tree, 'line'), STEP4_INITIAL_ROWS)
 
         self._step4_flagged_positions = [i for i, row in enumerate(visible_rows) if row.get('issue') != 'OK']
         self._step4_flagged_cursor = 0 if self._step4_flagged_positions else -1
@@ -720,6 +949,19 @@ class RadioShowApp(tk.Frame):
     def change_theme(self):
         self.current_theme_name = self.theme_var.get()
         # In a real app, save self.current_theme_name to a config file
+        self.schedule_theme_apply()
+
+    def schedule_theme_apply(self):
+        """Re-apply the theme shortly; a burst of requests (radio clicks, OS theme events) applies it once."""
+        if self._theme_apply_after_id is not None:
+            try:
+                self.root.after_cancel(self._theme_apply_after_id)
+            except (tk.TclError, AttributeError):
+                pass
+        self._theme_apply_after_id = self.root.after(THEME_APPLY_DEBOUNCE_MS, self._apply_pending_theme)
+
+    def _apply_pending_theme(self):
+        self._theme_apply_after_id = None
         theming.apply_theme_settings(self)
 
     def change_tts_engine(self):
@@ -730,6 +972,7 @@ class RadioShowApp(tk.Frame):
 
         self.selected_tts_engine_name = new_engine_name # Update internal tracker
         self.logic.logger.info(f"TTS Engine selection changed to: {new_engine_name}. Re-initializing.")
+        self._flush_pending_voice_config_save() # The voice list is about to be cleared and reloaded from disk
 
         # Clear runtime voice list and assignments. Default will be re-evaluated.
         self.state.voices = []
@@ -781,19 +1024,10 @@ class RadioShowApp(tk.Frame):
 
     def get_available_engine_names(self) -> list:
         """Return engine names available for selection (installed engines detected)."""
-        possible_engines = [
-            {"label": "Coqui XTTS", "value": "Coqui XTTS", "check_module": "TTS.api"},
-            {"label": "Chatterbox", "value": "Chatterbox", "check_module": "chatterbox.tts"}
-        ]
-        available = []
-        for engine_spec in possible_engines:
-            try:
-                __import__(engine_spec["check_module"])
-                available.append(engine_spec["label"])
-            except Exception:
-                continue
+        # Probed with find_spec (shared cache with the menu), not imported: importing TTS.api pulls in torch
+        available = [e['label'] for e in TTS_ENGINE_SPECS if _engine_module_available(e['check_module'])]
         # If none found, return the known list so user can still add mappings for offline environments
-        return available or [e['label'] for e in possible_engines]
+        return available or [e['label'] for e in TTS_ENGINE_SPECS]
 
     # def on_system_theme_change_event(self, event=None): # For future real-time updates
     #     self.detect_system_theme()
@@ -922,11 +1156,8 @@ class RadioShowApp(tk.Frame):
 
     # --- NEW METHOD: ADD A VOICE TO THE LIBRARY ---
     def add_voice_from_dialog_data(self, new_voice_data, source_filepath_str):
+        # The sample comes from a file dialog; a file that vanished since is reported by the copy below
         source_path = Path(source_filepath_str)
-        if not source_path.exists():
-            messagebox.showerror("Error", "File not found.")
-            return False
-
         voices_dir = self.state.output_dir / "voices"
         sanitized_name = re.sub(r'[^\w.-]+', '_', new_voice_data['name']).strip()
         dest_filename_base = f"{sanitized_name}_{source_path.stem}"
@@ -943,13 +1174,16 @@ class RadioShowApp(tk.Frame):
         try:
             shutil.copy2(source_path, dest_path)
             self.logic.logger.info(f"Copied voice file from '{source_path}' to '{dest_path}'")
+        except FileNotFoundError:
+            messagebox.showerror("Error", "File not found.")
+            return False
         except Exception as e:
             messagebox.showerror("File Copy Error", f"Could not copy the voice file to the application directory.\n\nError: {e}")
             self.logic.logger.error(f"Failed to copy voice file to '{dest_path}': {e}")
             return False
         
         new_voice_data['path'] = str(dest_path)
-        self.state.voices.append(new_voice_data)
+        self.state.add_voice(new_voice_data)
         
         if not self.state.narrator_voice_info:
             self.state.narrator_voice_info = new_voice_data
@@ -968,7 +1202,7 @@ class RadioShowApp(tk.Frame):
         dialog = AddVoiceDialog(self.root, self._theme_colors)
         if dialog.result:
             new_voice_data = dialog.result
-            if any(v['name'] == new_voice_data['name'] for v in self.state.voices):
+            if self.state.find_voice(new_voice_data['name']) is not None:
                 messagebox.showwarning("Duplicate Name", "A voice with this name already exists.")
                 return
 
@@ -988,7 +1222,7 @@ class RadioShowApp(tk.Frame):
         if not selected_voice_name:
             messagebox.showwarning("No Selection", "Please select a voice from the dropdown to remove."); return
 
-        voice_to_delete = next((v for v in self.state.voices if v['name'] == selected_voice_name), None)
+        voice_to_delete = self.state.find_voice(selected_voice_name)
         if not voice_to_delete:
             messagebox.showerror("Error", "Could not find the selected voice data."); return
 
@@ -1012,7 +1246,7 @@ class RadioShowApp(tk.Frame):
             messagebox.showwarning("No Voice Selected", "Please select a voice from the dropdown to set as narrator.")
             return
 
-        selected_voice = next((v for v in self.state.voices if v['name'] == selected_voice_name), None)
+        selected_voice = self.state.find_voice(selected_voice_name)
         if selected_voice:
             self.state.narrator_voice_info = selected_voice
             self.voice_assignment_view.narrator_voice_label.config(text=f"Narrator: {selected_voice['name']}")
@@ -1028,7 +1262,7 @@ class RadioShowApp(tk.Frame):
             messagebox.showwarning("No Voice Selected", "Please select a voice from the dropdown to set as speaker.")
             return
 
-        selected_voice = next((v for v in self.state.voices if v['name'] == selected_voice_name), None)
+        selected_voice = self.state.find_voice(selected_voice_name)
         if selected_voice:
             self.state.speaker_voice_info = selected_voice
             self.voice_assignment_view.speaker_voice_label.config(text=f"Speaker: {selected_voice['name']}")
@@ -1140,9 +1374,9 @@ class RadioShowApp(tk.Frame):
 
     def update_voice_dropdown(self):
         if not hasattr(self.voice_assignment_view, 'voice_dropdown'): return # Guard clause
-        voice_names = sorted([v['name'] for v in self.state.voices])
+        voice_names = self.state.sorted_voice_names
         self.voice_assignment_view.voice_dropdown.config(values=voice_names)
-        if self.state.narrator_voice_info and self.state.narrator_voice_info['name'] in voice_names:
+        if self.state.narrator_voice_info and self.state.find_voice(self.state.narrator_voice_info['name']) is not None:
             self.voice_assignment_view.voice_dropdown.set(self.state.narrator_voice_info['name'])
         elif voice_names:
             self.voice_assignment_view.voice_dropdown.set(voice_names[0])
@@ -1161,7 +1395,7 @@ class RadioShowApp(tk.Frame):
             self.voice_assignment_view.voice_details_label.config(text="Details: N/A")
             return
 
-        selected_voice = next((v for v in self.state.voices if v['name'] == selected_voice_name), None)
+        selected_voice = self.state.find_voice(selected_voice_name)
         if selected_voice:
             gender = selected_voice.get('gender', 'Unknown')
             age_range = selected_voice.get('age_range', 'Unknown')
@@ -1180,7 +1414,7 @@ class RadioShowApp(tk.Frame):
 
         if messagebox.askyesno("Confirm Clear", "Are you sure you want to clear all voice assignments?"):
             self.state.voice_assignments.clear()
-            self.update_cast_list()
+            self.update_cast_list(speakers_changed=False)
             self.show_status_message("All voice assignments have been cleared.", "success")
             self.logic.logger.info("All voice assignments cleared by user.")
 
@@ -1191,7 +1425,7 @@ class RadioShowApp(tk.Frame):
             self.show_status_message("Select a voice from the dropdown to preview.", "warning")
             return
         
-        selected_voice = next((v for v in self.state.voices if v['name'] == selected_voice_name), None)
+        selected_voice = self.state.find_voice(selected_voice_name)
         if selected_voice:
             self.show_status_message(f"Generating preview for '{selected_voice_name}'...", "info")
             self.logic.start_voice_preview_thread(selected_voice)
@@ -1209,81 +1443,117 @@ class RadioShowApp(tk.Frame):
             messagebox.showwarning("No Voice Selected", "Please select a voice from the dropdown menu.\nYou may need to add one first using the 'Add New Voice' button."); return
 
         # Find the full voice dictionary
-        selected_voice = next((voice for voice in self.state.voices if voice['name'] == selected_voice_name), None)
+        selected_voice = self.state.find_voice(selected_voice_name)
         if selected_voice is None:
             return messagebox.showerror("Error", "Could not find the selected voice data. It may have been removed.")
 
         # Store the entire voice dictionary for the selected speaker
         self.state.voice_assignments[speaker_name] = selected_voice
         print(f"Assigned voice '{selected_voice['name']}' to '{speaker_name}'.")
-        self.update_cast_list()
+        self._refresh_cast_row(speaker_name)
 
     # --- UPDATED METHOD ---
-    def _populate_cast_tree(self, tree, speakers, is_full_detail):
-        """Helper to populate a cast list treeview."""
+    def _populate_cast_tree(self, tree, speakers, is_full_detail, line_counts=None):
+        """Helper to populate a cast list treeview. `line_counts` (from speaker_line_counts) is computed if not given."""
         if not tree: return
-        selected_item = tree.selection()
-        tree.delete(*tree.get_children())
+        if is_full_detail and line_counts is None:
+            line_counts = self.state.speaker_line_counts()
+        speaker_colors = self.state.speaker_colors
+        character_profiles = self.state.character_profiles
+        speaker_tag_name = theming.speaker_tag_name
+        # Assigned voice names resolved once for the whole cast
+        assigned_names = {speaker: voice.get('name', "Not Assigned") for speaker, voice in self.state.voice_assignments.items()}
+        rows = []
+        append = rows.append
         for i, speaker in enumerate(speakers):
-            speaker_color_tag = self.get_speaker_color_tag(speaker)
-            assigned_voice_name = self.state.voice_assignments.get(speaker, {}).get('name', "Not Assigned")
+            # Tag colors are defined once below, not per row through get_speaker_color_tag
+            tags = (speaker_tag_name(speaker) if speaker in speaker_colors else "default_tag", 'oddrow' if i & 1 else 'evenrow')
+            assigned_voice_name = assigned_names.get(speaker, "Not Assigned")
             
             if is_full_detail:
-                gender = self.state.character_profiles.get(speaker, {}).get('gender', 'N/A')
-                age_range = self.state.character_profiles.get(speaker, {}).get('age_range', 'N/A')
-                accent = self.state.character_profiles.get(speaker, {}).get('accent', 'N/A')
-                count = sum(1 for item in self.state.analysis_result if item.get('speaker') == speaker)
-                values = (speaker, assigned_voice_name, gender, age_range, accent, count)
+                profile = character_profiles.get(speaker, {})
+                values = (speaker, assigned_voice_name, profile.get('gender', 'N/A'), profile.get('age_range', 'N/A'),
+                          profile.get('accent', 'N/A'), line_counts[speaker])
             else:
                 values = (speaker, assigned_voice_name)
 
-            tree.insert('', tk.END, iid=speaker, values=values, tags=(speaker_color_tag,))
-        
-        if selected_item:
-            try: 
-                if tree.exists(selected_item[0]): tree.selection_set(selected_item)
-            except tk.TclError: pass
-        self.update_treeview_item_tags(tree)
-
-    def update_cast_list(self):
+            append((speaker, values, tags))
+
+        # Refreshes often change nothing visible in a tree (e.g. a voice assignment leaves the
+        # detail tree as it was); keep its rows, and with them selection and scroll position
+        tree_key = str(tree)
+        if rows != self._cast_tree_rows.get(tree_key) or len(tree.get_children()) != len(rows):
+            selected_item = tree.selection()
+            tree.delete(*tree.get_children())
+            self._bulk_insert_tree_rows(tree, rows)
+            self._cast_tree_rows[tree_key] = rows
+
+            if selected_item:
+                try: 
+                    if tree.exists(selected_item[0]): tree.selection_set(selected_item)
+                except tk.TclError: pass
+        # Rows were inserted with their final tags; only the tag colors need defining
+        theming.configure_treeview_tags(self, tree)
+
+    def update_cast_list(self, speakers_changed=True):
+        """Rebuilds the cast list from analysis_result and refreshes both cast trees.
+
+        Pass speakers_changed=False when only voice assignments changed; the speaker scan and
+        color reassignment are then skipped and just the trees are refreshed.
+        """
         if not self.state.analysis_result: return
-        unique_speakers = sorted(list(set(item['speaker'] for item in self.state.analysis_result)))
-        self.state.cast_list = unique_speakers
+        # One pass: keys are the unique speakers in first-appearance order (used for colors)
+        line_counts = self.state.speaker_line_counts()
+        if speakers_changed or not self.state.cast_list:
+            appearance_order = list(line_counts)
+            self.state.cast_list = sorted(appearance_order)
+
+            # Clear existing colors and reassign
+            self.state.speaker_colors.clear()
+            self._assign_colors_by_cast_order(appearance_order)
         
-        # Clear existing colors and reassign
-        self.state.speaker_colors.clear()
-        self._assign_colors_by_cast_order()
-        
-        self._populate_cast_tree(self.refinement_cast_tree, self.state.cast_list, is_full_detail=True)
+        self._populate_cast_tree(self.refinement_cast_tree, self.state.cast_list, is_full_detail=True, line_counts=line_counts)
         self._populate_cast_tree(self.assignment_cast_tree, self.state.cast_list, is_full_detail=False)
     
-    def _assign_colors_by_cast_order(self):
+    def _refresh_cast_row(self, speaker):
+        """Updates the voice column of one speaker's row in both cast trees after a voice assignment.
+
+        The cast itself is unchanged, so neither the analysis scan nor a tree rebuild is needed;
+        falls back to update_cast_list when a tree was not populated from the current cast.
+        """
+        voice = self.state.voice_assignments.get(speaker)
+        assigned_voice_name = voice.get('name', "Not Assigned") if voice else "Not Assigned"
+        for tree in (self.refinement_cast_tree, self.assignment_cast_tree):
+            if not tree: continue
+            rows = self._cast_tree_rows.get(str(tree))
+            index = next((i for i, row in enumerate(rows or ()) if row[0] == speaker), None)
+            if index is None:
+                return self.update_cast_list(speakers_changed=False)
+            iid, values, tags = rows[index]
+            if values[1] == assigned_voice_name: continue
+            try:
+                tree.set(iid, 'voice', assigned_voice_name)
+            except tk.TclError: # Row gone since the last populate
+                return self.update_cast_list(speakers_changed=False)
+            # Keep the cached rows in step with the tree so the next populate still sees it as current
+            rows[index] = (iid, (values[0], assigned_voice_name) + values[2:], tags)
+
+    def _assign_colors_by_cast_order(self, appearance_order=None):
         """Assign colors to speakers based on their first appearance order in the text"""
         # Get speakers in order of first appearance
-        seen_speakers = set()
-        appearance_order = []
-        for item in self.state.analysis_result:
-            speaker = item['speaker']
-            if speaker not in seen_speakers:
-                seen_speakers.add(speaker)
-                appearance_order.append(speaker)
-        
-        # Generate enough distinct colors for all speakers
-        import colorsys
-        num_speakers = len(appearance_order)
+        if appearance_order is None:
+            appearance_order = list(self.state.speaker_line_counts())
         
+        # The palette first, then generated colors for any further speakers
+        palette = self.color_palette
+        palette_size = len(palette)
+        speaker_colors = self.state.speaker_colors
         for i, speaker in enumerate(appearance_order):
-            if i < len(self.color_palette):
-                color = self.color_palette[i]
-            else:
-                # Generate additional colors using HSV color space
-                hue = (i * 137.508) % 360  # Golden angle for good distribution
-                saturation = 0.7 + (i % 3) * 0.1  # Vary saturation
-                value = 0.8 + (i % 2) * 0.2  # Vary brightness
-                rgb = colorsys.hsv_to_rgb(hue/360, saturation, value)
-                color = f"#{int(rgb[0]*255):02x}{int(rgb[1]*255):02x}{int(rgb[2]*255):02x}"
-            
-            self.state.speaker_colors[speaker] = color
+            speaker_colors[speaker] = palette[i] if i < palette_size else _generated_speaker_color(i)
+
+        # The cast trees define their tags when repopulated; the script and review trees keep their rows
+        theming.configure_treeview_tags(self, self.tree)
+        theming.configure_treeview_tags(self, self.review_tree)
 
     # --- END UPDATED METHOD (update_cast_list) ---
 
@@ -1293,13 +1563,9 @@ class RadioShowApp(tk.Frame):
         if not self._theme_colors:
             theming.apply_theme_settings(self) # Apply theme to populate _theme_colors if not already
             # This call will be theming.apply_theme_settings(self) after refactor
-        fg_color = self._theme_colors.get("status_fg", "blue") # Default
-        if msg_type == "success":
-            fg_color = self._theme_colors.get("success_fg", "green")
-        elif msg_type == "error" or msg_type == "warning": # Treat warnings as errors for visibility
-            fg_color = self._theme_colors.get("error_fg", "red")
-        
-        self.status_label.config(text=message, fg=fg_color)
+        # Warnings are treated as errors for visibility; anything else uses the status color
+        color_key, fallback = _STATUS_MESSAGE_COLORS.get(msg_type, ("status_fg", "blue"))
+        self.status_label.config(text=message, fg=self._theme_colors.get(color_key, fallback))
     # --- UPDATED METHOD ---
     def on_tts_initialization_complete(self):
         self.stop_progress_indicator() # Stop indicator on successful completion
@@ -1313,50 +1579,64 @@ class RadioShowApp(tk.Frame):
             self.show_status_message(status_msg, "success")
 
 
-            # Get engine-specific voices (like internal defaults)
-            # self.voices already contains user-loaded voices from load_voice_config (called in __init__ or change_tts_engine)
-            engine_voices = self.logic.current_tts_engine_instance.get_engine_specific_voices() # type: ignore
-            for eng_voice in engine_voices:
-                ui_voice_format = {'name': eng_voice['name'], 'path': eng_voice['id_or_path']}
-                if not any(v['path'] == ui_voice_format['path'] for v in self.state.voices):
-                    self.state.voices.append(ui_voice_format)
-                
-            # Default Voice Resolution:
-            # Try to re-establish default based on the name loaded from config,
-            # searching within the now complete self.voices list (user + current engine).
-            resolved_narrator_voice = None
-            if self.state.loaded_narrator_voice_name_from_config:
-                resolved_narrator_voice = next((v for v in self.state.voices if v['name'] == self.state.loaded_narrator_voice_name_from_config), None)
-
-            if resolved_narrator_voice:
-                self.state.narrator_voice_info = resolved_narrator_voice
-            else:
-                self.state.narrator_voice_info = None
-
-            resolved_speaker_voice = None
-            if self.state.loaded_speaker_voice_name_from_config:
-                resolved_speaker_voice = next((v for v in self.state.voices if v['name'] == self.state.loaded_speaker_voice_name_from_config), None)
-
-            if resolved_speaker_voice:
-                self.state.speaker_voice_info = resolved_speaker_voice
-            else:
-                self.state.speaker_voice_info = None
-
-            if self.state.narrator_voice_info:
-                self.narrator_voice_label.config(text=f"Narrator: {self.state.narrator_voice_info['name']}")
-            else:
-                self.voice_assignment_view.narrator_voice_label.config(text="Narrator: None (select or add one)")
-
-            if self.state.speaker_voice_info:
-                self.speaker_voice_label.config(text=f"Speaker: {self.state.speaker_voice_info['name']}")
-            else:
-                self.voice_assignment_view.speaker_voice_label.config(text="Speaker: None (select or add one)")
+            self._merge_engine_voices()
         else: # No TTS engine instance (e.g., none available or init failed before instance creation)
             self.show_status_message("TTS Engine not available or failed to initialize.", "error")
             self.voice_assignment_view.default_voice_label.config(text="Default: None")
 
         self.update_voice_dropdown() # Ensure dropdown is populated, now potentially with internal voice
         # self.update_status_label_color() # show_status_message handles this
+
+    def _merge_engine_voices(self):
+        """Add the engine's internal voices to the user voices and resolve the saved narrator/speaker defaults."""
+        # Get engine-specific voices (like internal defaults)
+        # self.voices already contains user-loaded voices from load_voice_config (called in __init__ or change_tts_engine)
+        engine_voices = self.logic.current_tts_engine_instance.get_engine_specific_voices() # type: ignore
+        known_paths = {v['path'] for v in self.state.voices} # One pass instead of a scan per engine voice
+        for eng_voice in engine_voices:
+            ui_voice_format = {'name': eng_voice['name'], 'path': eng_voice['id_or_path']}
+            if ui_voice_format['path'] not in known_paths:
+                self.state.add_voice(ui_voice_format)
+                known_paths.add(ui_voice_format['path'])
+            
+        # Default Voice Resolution:
+        # Try to re-establish default based on the name loaded from config,
+        # searching within the now complete self.voices list (user + current engine).
+        resolved_narrator_voice = None
+        if self.state.loaded_narrator_voice_name_from_config:
+            resolved_narrator_voice = self.state.find_voice(self.state.loaded_narrator_voice_name_from_config)
+
+        if resolved_narrator_voice:
+            self.state.narrator_voice_info = resolved_narrator_voice
+        else:
+            self.state.narrator_voice_info = None
+
+        resolved_speaker_voice = None
+        if self.state.loaded_speaker_voice_name_from_config:
+            resolved_speaker_voice = self.state.find_voice(self.state.loaded_speaker_voice_name_from_config)
+
+        if resolved_speaker_voice:
+            self.state.speaker_voice_info = resolved_speaker_voice
+        else:
+            self.state.speaker_voice_info = None
+
+        if self.state.narrator_voice_info:
+            self.narrator_voice_label.config(text=f"Narrator: {self.state.narrator_voice_info['name']}")
+        else:
+            self.voice_assignment_view.narrator_voice_label.config(text="Narrator: None (select or add one)")
+
+        if self.state.speaker_voice_info:
+            self.speaker_voice_label.config(text=f"Speaker: {self.state.speaker_voice_info['name']}")
+        else:
+            self.voice_assignment_view.speaker_voice_label.config(text="Speaker: None (select or add one)")
+
+    @property
+    def config_manager(self):
+        # app_config.json is only consulted by file and training dialogs, so startup does not parse it
+        if self._config_manager is None:
+            from config_manager import ConfigManager
+            self._config_manager = ConfigManager(self.state.output_dir / 'app_config.json')
+        return self._config_manager
     @property
     def refinement_cast_tree(self):
         return self.cast_refinement_view.cast_tree if hasattr(self, 'cast_refinement_view') else None
@@ -1423,32 +1703,45 @@ class RadioShowApp(tk.Frame):
         return self.review_view.tree if hasattr(self.review_view, 'tree') else None
     # Add other review_view widget properties if directly accessed from AudiobookCreatorApp
         
-    def set_ui_state(self, state, exclude=None):
-        if exclude is None: exclude = []
-        widgets_to_toggle = [
+    def _collect_toggleable_widgets(self):
+        """Widgets set_ui_state enables/disables. The views live for the whole session, so this runs once.
+
+        ttk Treeviews have no -state option (configuring it only raised a TclError on every call), so
+        the trees are left out.
+        """
+        widgets = [
             self.wizard_view.upload_button, self.wizard_view.select_folder_button, self.wizard_view.next_step_button, self.wizard_view.edit_text_button,
             self.editor_view.save_button, self.editor_view.back_button, self.editor_view.analyze_button,
-            self.editor_view.text_editor, self.tree,
-            self.back_button_refinement, self.cast_refinement_view.next_button, self.resolve_button, self.llm_test_button, self.refine_speakers_button, self.refinement_cast_tree, self.rename_button,
-            self.voice_assignment_view.back_button, self.tts_button, self.assignment_cast_tree,
+            self.editor_view.text_editor,
+            self.back_button_refinement, self.cast_refinement_view.next_button, self.resolve_button, self.llm_test_button, self.refine_speakers_button, self.rename_button,
+            self.voice_assignment_view.back_button, self.tts_button,
             self.add_voice_button, self.remove_voice_button, self.auto_assign_button, self.clear_assignments_button,
             self.voice_assignment_view.preview_voice_button, self.assign_button, self.set_narrator_voice_button, self.set_speaker_voice_button, self.voice_dropdown,
-            
         ]
-        if hasattr(self.review_view, 'play_selected_button'): widgets_to_toggle.append(self.review_view.play_selected_button)
-        if hasattr(self.review_view, 'regenerate_selected_button'): widgets_to_toggle.append(self.review_view.regenerate_selected_button)
-        if hasattr(self.review_view, 'assemble_audiobook_button'): widgets_to_toggle.append(self.review_view.assemble_audiobook_button)
-        if hasattr(self.review_view, 'back_to_analysis_button'): widgets_to_toggle.append(self.review_view.back_to_analysis_button)
-        if self.review_tree: widgets_to_toggle.append(self.review_tree)
-
-        for widget in widgets_to_toggle:
-            if widget and widget not in exclude:
+        for name in ('play_selected_button', 'regenerate_selected_button', 'assemble_audiobook_button', 'back_to_analysis_button'):
+            widgets.append(getattr(self.review_view, name, None))
+        return tuple(w for w in widgets if w)
+
+    def set_ui_state(self, state, exclude=None):
+        if self._toggleable_widgets is None:
+            self._toggleable_widgets = self._collect_toggleable_widgets()
+        exclude = set(exclude) if exclude else set()
+        if self._editor_loading_txt_path is not None:
+            # Keep the editor read-only until every streamed chunk has been appended
+            exclude.add(self.editor_view.text_editor)
+
+        for widget in self._toggleable_widgets:
+            if widget not in exclude:
                 try: widget.config(state=state)
                 except (tk.TclError, AttributeError): pass
         
-        # Only change cursor if colors are available (theme applied)
+        # Only change cursor if colors are available (theme applied); nothing else sets the root
+        # cursor, so it is only reconfigured when it actually changes
         if self._theme_colors:
-            self.root.config(cursor="watch" if state == tk.DISABLED else "")
+            cursor = "watch" if state == tk.DISABLED else ""
+            if cursor != self._root_cursor:
+                self.root.config(cursor=cursor)
+                self._root_cursor = cursor
 
     def _update_wizard_button_states(self):
         """ Helper to set states of wizard step buttons based on ebook and txt paths. """
@@ -1472,21 +1765,28 @@ class RadioShowApp(tk.Frame):
             return "default_tag"  # Return default instead of assigning new colors
         
         color = self.state.speaker_colors[speaker_name]
-        sanitized_speaker_name = re.sub(r'[^a-zA-Z0-9_]', '_', speaker_name)
-        tag_name = f"speaker_{sanitized_speaker_name}"
+        tag_name = theming.speaker_tag_name(speaker_name)
+        # Called per row (e.g. the review table); only redefine the tag when its color changed
+        if self._speaker_tag_colors.get(tag_name) == color:
+            return tag_name
 
         # Ensure the tag is configured in all relevant treeviews
-        for treeview in [self.tree, self.refinement_cast_tree, self.assignment_cast_tree, self.review_tree]:
+        treeviews = (self.tree, self.refinement_cast_tree, self.assignment_cast_tree, self.review_tree)
+        for treeview in treeviews:
             if treeview:
                 treeview.tag_configure(tag_name, foreground=color)
+        if all(treeviews): # A tree created later must still get the tag
+            self._speaker_tag_colors[tag_name] = color
         return tag_name
 
-    def _hide_all_main_frames(self):
-        self.wizard_frame.pack_forget()
-        self.editor_frame.pack_forget()
-        self.cast_refinement_frame.pack_forget()
-        self.voice_assignment_frame.pack_forget()
-        self.review_frame.pack_forget()
+    def _show_main_frame(self, view_frame):
+        """Show one main view frame in content_frame's shared grid cell, removing the previous one."""
+        theming.restyle_if_stale(self, view_frame)
+        previous = self._current_view_frame
+        if previous is not None and previous is not view_frame:
+            previous.grid_remove()
+        view_frame.grid()
+        self._current_view_frame = view_frame
 
     def _apply_bounded_geometry(self, width, height):
         """Resize the window, clamping its current position so it stays fully on-screen."""
@@ -1496,42 +1796,85 @@ class RadioShowApp(tk.Frame):
         height = min(height, max(480, screen_h - 80))
         x = max(0, min(self.root.winfo_x(), screen_w - width))
         y = max(0, min(self.root.winfo_y(), screen_h - height))
-        self.root.geometry(f"{width}x{height}+{x}+{y}")
+        geometry = f"{width}x{height}+{x}+{y}"
+        if self.root.geometry() != geometry: # Avoid a relayout when the size is already right
+            self.root.geometry(geometry)
 
     def show_wizard_view(self, resize=True):
-        self._hide_all_main_frames()
         if resize: self._apply_bounded_geometry(800, 800)
-        self.wizard_frame.pack(fill=tk.BOTH, expand=True)
+        self._show_main_frame(self.wizard_frame)
 
     def show_editor_view(self, resize=True):
         # Reload from disk whenever the txt_path has changed since the editor was last populated.
         # This ensures a fresh book always shows its own text even if the editor still holds
         # content from a previous book (e.g. after "Start Over").
-        if self.state.txt_path and self.state.txt_path.exists():
-            if self.state.txt_path != getattr(self, '_editor_loaded_txt_path', None):
-                try:
-                    with open(self.state.txt_path, 'r', encoding='utf-8') as f: content = f.read()
-                    self.editor_view.text_editor.delete('1.0', tk.END)
-                    self.editor_view.text_editor.insert('1.0', content)
-                    self._editor_loaded_txt_path = self.state.txt_path
-                    self.show_status_message("Text loaded for editing.", "info")
-                except Exception as e:
-                    self.show_status_message(f"Error: Could not load text for editing. Error: {e}", "error")
-        elif not self.state.txt_path:
+        # The path comparison comes first: switching back to an editor that already holds this book costs no stat
+        txt_path = self.state.txt_path
+        if txt_path:
+            if txt_path not in (self._editor_loaded_txt_path, self._editor_loading_txt_path) and txt_path.exists():
+                self._start_editor_text_load(txt_path)
+        else:
             # No book loaded — ensure any stale content is cleared
+            self._cancel_editor_text_load()
             self.editor_view.text_editor.delete('1.0', tk.END)
             self._editor_loaded_txt_path = None
                 
                 
-        self._hide_all_main_frames()
         if resize: self._apply_bounded_geometry(800, 700)
-        self.editor_frame.pack(fill=tk.BOTH, expand=True)
+        self._show_main_frame(self.editor_frame)
         
+    def _start_editor_text_load(self, txt_path):
+        """Stream txt_path into the editor: a worker reads it in chunks, the update queue inserts them."""
+        self._cancel_editor_text_load()
+        token = self._editor_load_token
+        self._editor_loading_txt_path = txt_path
+        self.editor_view.text_editor.delete('1.0', tk.END)
+        self.editor_view.text_editor.config(state=tk.DISABLED) # Read-only until the whole file is in
+
+        def _read_chunks():
+            try:
+                with open(txt_path, 'r', encoding='utf-8') as f:
+                    while True:
+                        chunk = f.read(EDITOR_LOAD_CHUNK_CHARS)
+                        if not chunk or token != self._editor_load_token:
+                            break
+                        self.update_queue.put({'editor_text_chunk': chunk, 'token': token})
+                self.update_queue.put({'editor_text_loaded': txt_path, 'token': token})
+            except Exception as e:
+                self.update_queue.put({'editor_text_loaded': txt_path, 'token': token, 'load_error': str(e)})
+
+        threading.Thread(target=_read_chunks, daemon=True).start()
+
+    def _cancel_editor_text_load(self):
+        """Abandon an in-flight editor load; its remaining queued chunks are ignored."""
+        self._editor_load_token += 1
+        if self._editor_loading_txt_path is not None:
+            self._editor_loading_txt_path = None
+            self.editor_view.text_editor.config(state=tk.NORMAL)
+
+    def _handle_editor_text_chunk_update(self, update):
+        if update['token'] != self._editor_load_token:
+            return
+        text_editor = self.editor_view.text_editor
+        text_editor.config(state=tk.NORMAL)
+        text_editor.insert(tk.END, update['editor_text_chunk'])
+        text_editor.config(state=tk.DISABLED)
+
+    def _handle_editor_text_loaded_update(self, update):
+        if update['token'] != self._editor_load_token:
+            return
+        self._editor_loading_txt_path = None
+        self.editor_view.text_editor.config(state=tk.NORMAL)
+        if update.get('load_error'):
+            self.show_status_message(f"Error: Could not load text for editing. Error: {update['load_error']}", "error")
+            return
+        self._editor_loaded_txt_path = update['editor_text_loaded']
+        self.show_status_message("Text loaded for editing.", "info")
+
     def show_cast_refinement_view(self, resize=True):
-        self._hide_all_main_frames()
         if resize:
             self._apply_bounded_geometry(1000, 900)
-        self.cast_refinement_frame.pack(fill=tk.BOTH, expand=True)
+        self._show_main_frame(self.cast_refinement_frame)
 
         # Refresh data and UI elements for analysis view
         # on_analysis_complete will populate tree, cast_list, and update relevant button states
@@ -1549,9 +1892,8 @@ class RadioShowApp(tk.Frame):
         self.set_ui_state(tk.NORMAL) # General UI enablement
 
     def show_voice_assignment_view(self, resize=True):
-        self._hide_all_main_frames()
         if resize: self._apply_bounded_geometry(800, 700)
-        self.voice_assignment_frame.pack(fill=tk.BOTH, expand=True)
+        self._show_main_frame(self.voice_assignment_frame)
         self.update_cast_list() # Ensure the cast list is populated
         self.update_voice_dropdown()
         self.show_status_message("Assign voices to each speaker.", "info")
@@ -1811,30 +2153,27 @@ class RadioShowApp(tk.Frame):
         self.state.active_thread = None
         self.state.last_operation = None
     def show_review_view(self):
-        self._hide_all_main_frames()
         self._apply_bounded_geometry(900, 700)
-        self.review_frame.pack(fill=tk.BOTH, expand=True)
+        self._show_main_frame(self.review_frame)
         self.populate_review_tree()
 
     def sanitize_for_tts(self, text):
         """Removes characters/patterns that can cause issues with TTS engines."""
         original_text = text or ""
         # Remove text within square brackets (e.g., [laughter])
-        text = re.sub(r'\[.*?\]', '', text)
+        text = _RE_TTS_BRACKETS.sub('', text)
         # Remove text within parentheses (e.g., (whispering))
-        text = re.sub(r'\(.*\)', '', text)
-        # Remove asterisks (often used for emphasis or actions)
-        text = text.replace('*', ''); text = re.sub(r'\s+', ' ', text)
-        # Remove various quote characters
-        text = re.sub(r'[“”‘’"\\]', '', text) # Remove various quote characters
-        text = re.sub(r'\.{3,}', ', ', text)
-        text = re.sub(r'\s*--\s*', ', ', text)
+        text = _RE_TTS_PARENS.sub('', text)
+        # Remove asterisks (often used for emphasis or actions) and various quote characters
+        text = text.translate(_TTS_STRIP_CHARS)
+        text = _RE_TTS_ELLIPSIS.sub(', ', text)
+        text = _RE_TTS_DOUBLE_DASH.sub(', ', text)
         text = text.replace('—', ', ').replace('–', ', ')
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = _RE_TTS_WHITESPACE.sub(' ', text).strip()
 
         # Chatterbox is more sensitive to all-caps lines and header-like fragments.
         if getattr(self, 'selected_tts_engine_name', '') == 'Chatterbox' and text:
-            words = re.findall(r"[A-Za-z']+", original_text)
+            words = _RE_TTS_WORDS.findall(original_text)
             uppercase_words = [w for w in words if len(w) > 2 and w.isupper()]
             is_mostly_upper = bool(words) and (len(uppercase_words) / max(len(words), 1)) >= 0.6
             is_short_header = len(words) <= 10 and len(text) <= 90
@@ -1844,25 +2183,32 @@ class RadioShowApp(tk.Frame):
                 acronym_allowlist = {'USS', 'NCC', 'US', 'UK', 'AI', 'II', 'III', 'IV', 'VI', 'VII', 'VIII', 'IX', 'X'}
                 converted_tokens = []
                 for token in text.split():
-                    bare = re.sub(r'[^A-Za-z0-9]', '', token)
+                    bare = _RE_TTS_NON_ALNUM.sub('', token)
                     if bare.isupper() and (len(bare) > 4 or bare not in acronym_allowlist):
                         converted_tokens.append(token.capitalize())
                     else:
                         converted_tokens.append(token)
                 text = ' '.join(converted_tokens)
 
-            if is_short_header and not re.search(r'[.!?]$', text):
+            if is_short_header and not _RE_TTS_END_PUNCT.search(text):
                 text = f"{text}."
 
         return text.strip()
 
     def update_timer(self):
-        self.timer_seconds += 1; self.status_label.config(text=f"Working... Please wait. ({self.timer_seconds}s elapsed)")
-        self.timer_id = self.root.after(1000, self.update_timer)
+        # Elapsed time comes from the monotonic clock, so late after() callbacks don't drift the count
+        elapsed = time.monotonic() - self._timer_started_at
+        seconds = int(elapsed)
+        if seconds != self.timer_seconds:
+            self.timer_seconds = seconds
+            text = _TIMER_TEXTS[seconds] if seconds < len(_TIMER_TEXTS) else f"Working... Please wait. ({seconds}s elapsed)"
+            self.status_label.config(text=text)
+        # Wake just after the next whole second instead of every 1000 ms from now
+        self.timer_id = self.root.after(int((seconds + 1 - elapsed) * 1000) + 1, self.update_timer)
         
     def start_progress_indicator(self, status_text="Working..."):
         self.set_ui_state(tk.DISABLED); self.progressbar.pack(fill=tk.X, padx=5, pady=(0,5), expand=True); self.progressbar.start()
-        self.timer_seconds = 0; self.status_label.config(text=status_text); self.update_timer()
+        self.timer_seconds = 0; self._timer_started_at = time.monotonic(); self.status_label.config(text=status_text); self.update_timer()
 
     def stop_progress_indicator(self):
         if self.timer_id: self.root.after_cancel(self.timer_id); self.timer_id = None
@@ -1882,20 +2228,21 @@ class RadioShowApp(tk.Frame):
         
         # Clear and repopulate the cast list first to assign colors
         if not self.state.analysis_result: return
-        unique_speakers = sorted(list(set(item['speaker'] for item in self.state.analysis_result)))
-        self.state.cast_list = unique_speakers
+        line_counts = self.state.speaker_line_counts()
+        appearance_order = list(line_counts)
+        self.state.cast_list = sorted(appearance_order)
         self.state.speaker_colors.clear()
-        self._assign_colors_by_cast_order()
+        self._assign_colors_by_cast_order(appearance_order)
         
         # Now populate the tree with proper colors
         self._refresh_step4_table()
         
         # Populate the cast trees
-        self._populate_cast_tree(self.refinement_cast_tree, self.state.cast_list, is_full_detail=True)
+        self._populate_cast_tree(self.refinement_cast_tree, self.state.cast_list, is_full_detail=True, line_counts=line_counts)
         self._populate_cast_tree(self.assignment_cast_tree, self.state.cast_list, is_full_detail=False)
         
         # Update button states specific to analysis view
-        has_ambiguous_speakers = any(item['speaker'] == 'AMBIGUOUS' for item in self.state.analysis_result)
+        has_ambiguous_speakers = 'AMBIGUOUS' in line_counts
         if self.resolve_button: self.resolve_button.config(state=tk.NORMAL if has_ambiguous_speakers else tk.DISABLED)
         if self.llm_test_button: self.llm_test_button.config(state=tk.NORMAL if self.state.analysis_result else tk.DISABLED)
         if self.refine_speakers_button: self.refine_speakers_button.config(state=tk.NORMAL if not has_ambiguous_speakers and self.state.cast_list else tk.DISABLED)
@@ -1919,18 +2266,48 @@ class RadioShowApp(tk.Frame):
         new_name = simpledialog.askstring("Rename Speaker", f"Enter new name for '{original_name}':", parent=self.root)
         
         if not new_name or not new_name.strip() or new_name.strip() == original_name: return
-        new_name = new_name.strip()
+        new_name = sys.intern(new_name.strip())
+
+        # A merge into an existing speaker shifts first-appearance colors, and the special names
+        # change Step 4 issue flags; both need the full rebuild. A plain rename is patched in place.
+        needs_rebuild = (new_name in self.state.cast_list or
+                         {original_name.upper(), new_name.upper()} & _UNRESOLVED_SPEAKERS)
 
         if original_name in self.state.speaker_colors:
             self.state.speaker_colors[new_name] = self.state.speaker_colors.pop(original_name)
 
-        for item in self.state.analysis_result:
-            if item['speaker'] == original_name: item['speaker'] = new_name
+        renamed_indices = []
+        for idx, item in enumerate(self.state.analysis_result):
+            if item['speaker'] == original_name:
+                item['speaker'] = new_name
+                renamed_indices.append(idx)
 
         if original_name in self.state.voice_assignments: self.state.voice_assignments[new_name] = self.state.voice_assignments.pop(original_name)
         if original_name in self.state.character_profiles: self.state.character_profiles[new_name] = self.state.character_profiles.pop(original_name)
 
-        self.on_analysis_complete() # This will re-populate tree and cast_list with new colors/tags
+        tree = self.cast_refinement_view.tree
+        if needs_rebuild or not tree:
+            self.on_analysis_complete() # This will re-populate tree and cast_list with new colors/tags
+            return
+
+        # Touch only the renamed rows that are in the (possibly filtered) table; stripes stay put
+        speaker_color_tag = self.get_speaker_color_tag(new_name)
+        for idx in renamed_indices:
+            item_id = f"step4_{idx}"
+            if tree.exists(item_id):
+                tree.set(item_id, 'speaker', new_name)
+                stripe_tags = tuple(t for t in tree.item(item_id, 'tags') if t in ('evenrow', 'oddrow'))
+                tree.item(item_id, tags=(speaker_color_tag,) + stripe_tags)
+        for row in self._step4_visible_rows:
+            if row['speaker'] == original_name: row['speaker'] = new_name
+        # Same speakers in the same appearance order, so the colors (moved above) stand; re-sort just the one name
+        cast_list = self.state.cast_list
+        if original_name in cast_list:
+            cast_list.remove(original_name)
+            insort(cast_list, new_name)
+            self.update_cast_list(speakers_changed=False)
+        else: # Cast list out of step with the table; derive it again
+            self.update_cast_list()
 
     def edit_selected_speaker_profile(self):
         try:
@@ -2004,34 +2381,53 @@ class RadioShowApp(tk.Frame):
 
         # Style the combobox editor based on the current theme
         # This is tricky as it's a temporary widget. For now, it uses ttk defaults.
+        self.cancel_speaker_cell_edit() # At most one editor open at a time
         editor = ttk.Combobox(tree_widget, values=self.state.cast_list); editor.set(current_speaker); editor.place(x=x, y=y, width=width, height=height); editor.focus_set()
+        self._speaker_cell_editor = editor
         editor.after(10, lambda: editor.event_generate(''))
         def on_edit_commit(event):
-            new_value = editor.get()
+            new_value = sys.intern(editor.get())
             if new_value and new_value != current_speaker:
                 tree_widget.set(item_id, column_id, new_value)
                 try:
-                    item_index = tree_widget.index(item_id)
+                    # The iid carries the analysis_result index, so no O(N) search is needed
+                    # (and filtered views, where tree position != index, stay correct).
+                    item_index = self._step4_original_index(item_id)
                     self.state.analysis_result[item_index]['speaker'] = new_value
-                    self.update_treeview_item_tags(tree_widget)
-                except (ValueError, IndexError): print(f"Warning: Could not find item {item_id} to update master data.")
+                    # Only this row's speaker tag changes; keep its stripe tag
+                    stripe_tags = tuple(t for t in tree_widget.item(item_id, 'tags') if t in ('evenrow', 'oddrow'))
+                    tree_widget.item(item_id, tags=(self.get_speaker_color_tag(new_value),) + stripe_tags)
+                except (ValueError, IndexError, TypeError): print(f"Warning: Could not find item {item_id} to update master data.")
             editor.destroy()
         def on_edit_cancel(event): editor.destroy()
-        def on_scroll_cancel(event): 
-            if editor.winfo_exists(): editor.destroy()
         editor.bind('<<ComboboxSelected>>', on_edit_commit); editor.bind('<Return>', on_edit_commit); editor.bind('<Escape>', on_edit_cancel)
-        # Bind scroll events to cancel the editor
-        tree_widget.bind('<MouseWheel>', on_scroll_cancel, add='+')
-        tree_widget.bind('<Button-4>', on_scroll_cancel, add='+')
-        tree_widget.bind('<Button-5>', on_scroll_cancel, add='+')
+        # Scroll events cancel the editor through cancel_speaker_cell_edit, bound once on the tree by the view
+
+    def cancel_speaker_cell_edit(self, _event=None):
+        """Close the Step 4 speaker cell editor if one is open."""
+        editor, self._speaker_cell_editor = self._speaker_cell_editor, None
+        if editor is not None:
+            try:
+                editor.destroy()
+            except tk.TclError:
+                pass
 
     def start_hybrid_analysis(self):
-        full_text = self.editor_view.text_editor.get('1.0', tk.END)
-        if not full_text.strip():
+        if self._editor_loading_txt_path is not None:
+            self.show_status_message("Please wait: the text is still loading into the editor.", "warning")
+            return
+        # Tk looks for the first non-blank character itself; no copy of the whole book just to strip() it
+        if not self.editor_view.text_editor.search(r'\S', '1.0', tk.END, regexp=True):
             self.show_status_message("Cannot analyze: Text editor is empty.", "warning")
             return # messagebox.showwarning("Empty Text", "There is no text to analyze.")
 
         self.start_progress_indicator("Running high-speed analysis (Pass 1)...") 
+        # Copying a long book out of the Text widget takes a moment; let the progress indicator paint first
+        self.root.after_idle(self._start_rules_pass_with_editor_text)
+
+    def _start_rules_pass_with_editor_text(self):
+        # Tk is not thread-safe, so the text is read here and handed to the worker
+        full_text = self.editor_view.text_editor.get('1.0', tk.END)
         # This will now call a method in AppLogic to start the thread
         self.logic.start_rules_pass_thread(full_text)
 
@@ -2286,7 +2682,8 @@ class RadioShowApp(tk.Frame):
         self.state.active_thread = None
         self.state.last_operation = None
 
-    def _handle_progress_update(self, update):
+    def _handle_progress_update(self, update, repaint=True):
+        """Progress bar/status updates. With repaint=False a pass-2 resolution message only applies its data."""
         if update.get('assembly_total_duration'):
             self.progressbar.config(maximum=update['assembly_total_duration'])
         elif update.get('assembly_progress'):
@@ -2309,8 +2706,7 @@ class RadioShowApp(tk.Frame):
             items_processed = update['asr_validation_progress']
             self.progressbar.config(maximum=total_items, value=items_processed)
             self.show_status_message(f"ASR scan {items_processed} / {total_items} clips...", "info")
-        elif 'progress' in update and 'original_index' in update and 'new_speaker' in update: # LLM progress
-            total_items = self.progressbar['maximum'] # type: ignore
+        elif _is_speaker_resolution_update(update): # LLM progress
             items_processed = update['progress'] + 1
             idx = update['original_index']
             current_speaker = self.state.analysis_result[idx].get('speaker', 'UNKNOWN')
@@ -2329,6 +2725,7 @@ class RadioShowApp(tk.Frame):
                     source = 'llm_pass_2'
                     confidence = 'high'
 
+            if type(final_speaker) is str: final_speaker = sys.intern(final_speaker)
             self.state.analysis_result[idx]['speaker'] = final_speaker
             self.state.analysis_result[idx]['speaker_source'] = source
             self.state.analysis_result[idx]['speaker_confidence'] = confidence
@@ -2349,18 +2746,64 @@ class RadioShowApp(tk.Frame):
                 if items_processed % 25 == 0:
                     self.update_cast_list() # Refresh periodically during long Pass 2 runs
             if self.tree:
-                tree_children = self.tree.get_children('')
-                if idx < len(tree_children):
-                    item_id = tree_children[idx]
-                    self.tree.set(item_id, '#1', final_speaker)
-            self.progressbar.config(value=items_processed)
-            self.status_label.config(text=f"Resolving {items_processed} / {total_items} speakers...")
+                # Rows are keyed by analysis index, so no get_children() scan per message
+                try:
+                    self.tree.set(f"step4_{idx}", 'speaker', final_speaker)
+                except tk.TclError: # Row filtered out of Step 4 or not inserted yet
+                    pass
+            if repaint:
+                total_items = self.progressbar['maximum'] # type: ignore
+                self.progressbar.config(value=items_processed)
+                self.status_label.config(text=f"Resolving {items_processed} / {total_items} speakers...")
+
+    def _signal_update_queue(self):
+        """UpdateQueue wakeup: queue a virtual event so the Tk loop drains the queue right away."""
+        try:
+            # From a worker thread tkinter hands this to the Tcl thread; 'tail' queues it behind pending events
+            self.root.event_generate(UPDATE_QUEUE_EVENT, when='tail')
+        except (RuntimeError, tk.TclError): # Mainloop not running yet, or shutting down; the fallback poll drains it
+            pass
+
+    def _on_update_queue_event(self, _event=None):
+        """Wakeup event: drain now, or at the end of the minimum interval since the last drain."""
+        wait_ms = int((self._update_queue_drained_at - time.monotonic()) * 1000) + UPDATE_QUEUE_MIN_INTERVAL_MS
+        # A backlog of a full batch or more is drained straight away, as the cap continuation does
+        if wait_ms <= 0 or len(self.update_queue) >= UPDATE_QUEUE_BATCH_LIMIT:
+            self.check_update_queue()
+            return
+        # Nothing new signals until the drain calls begin_drain, so this one scheduled drain picks everything up
+        if self._update_queue_poll_id is not None:
+            self.root.after_cancel(self._update_queue_poll_id)
+        self._update_queue_poll_id = self.root.after(wait_ms, self.check_update_queue)
 
     def check_update_queue(self):
+        # Runs from the wakeup event and the scheduled polls; keep a single poll scheduled
+        if self._update_queue_poll_id is not None:
+            self.root.after_cancel(self._update_queue_poll_id)
+            self._update_queue_poll_id = None
+        self._update_queue_drained_at = time.monotonic()
+        self.update_queue.begin_drain()
+        updates = []
         try:
-            # New handlers at the top for quick UI feedback
-            while not self.update_queue.empty():
-                update = self.update_queue.get_nowait()
+            # Take what the workers have queued in one go (up to a cap, so a flood of updates
+            # cannot block input and redraws for long), then process it as a batch.
+            while len(updates) < UPDATE_QUEUE_BATCH_LIMIT:
+                try:
+                    updates.append(self.update_queue.popleft())
+                except IndexError:
+                    break
+
+            # Status and progress-bar messages only repaint, so within a batch only the last
+            # one of each kind can ever be seen; skip the ones it would immediately overwrite.
+            kinds = [_coalesce_kind(update) for update in updates]
+            last_pos_by_kind = {kind: pos for pos, kind in enumerate(kinds) if kind}
+            # Pass-2 resolution messages each carry a row's speaker and must all be applied, but
+            # only the last of a consecutive run needs to repaint the progress bar and label.
+            resolution = [_is_speaker_resolution_update(update) for update in updates]
+
+            for pos, update in enumerate(updates):
+                if kinds[pos] and last_pos_by_kind[kinds[pos]] != pos:
+                    continue
                 
                 # Process all types of updates directly here or delegate.
                 # No need for separate loops or putting back, just process everything
@@ -2369,6 +2812,10 @@ class RadioShowApp(tk.Frame):
                 # High-priority updates like 'error' should be first.
                 if update.get('generation_total_chunks'):
                     self.progressbar.config(maximum=update['generation_total_chunks'])
+                elif 'editor_text_chunk' in update:
+                    self._handle_editor_text_chunk_update(update)
+                elif 'editor_text_loaded' in update:
+                    self._handle_editor_text_loaded_update(update)
                 elif 'file_accepted' in update:
                         self._handle_file_accepted_update(update)
                 elif 'metadata_extracted' in update:
@@ -2391,6 +2838,8 @@ class RadioShowApp(tk.Frame):
                     self._handle_assembly_started_update()
                 elif update.get('rules_pass_complete'):
                     self._handle_rules_pass_complete_update(update)
+                elif 'voices_loaded' in update:
+                    self._handle_voices_loaded_update(update['voices_loaded'])
                 elif update.get('tts_init_complete'):
                     self._handle_tts_init_complete_update()
                 elif update.get('generation_for_review_complete'):
@@ -2410,10 +2859,13 @@ class RadioShowApp(tk.Frame):
                     self._handle_batch_complete_update(update)
                 elif update.get('conversion_complete'):
                     self._handle_conversion_complete_update(update)
+                elif update.get('system_theme_detected'):
+                    theming.on_system_theme_detected(self, update['system_theme_detected'])
                 elif update.get('training_progress'):
                     self._handle_training_progress_update(update['training_progress'])
                 else: # General progress updates
-                    self._handle_progress_update(update)
+                    repaint = not (resolution[pos] and pos + 1 < len(updates) and resolution[pos + 1])
+                    self._handle_progress_update(update, repaint=repaint)
                 
                 # If a handler returned (e.g. error), it would have done so already.
                 # Otherwise, we continue to process other messages in the queue in this iteration.
@@ -2434,8 +2886,12 @@ class RadioShowApp(tk.Frame):
                 self.state.active_thread = None # Clear the dead thread
                 self.state.last_operation = None
 
-            # Always reschedule the queue check to keep the UI responsive
-            self.root.after(100, self.check_update_queue)
+            # When the cap left updates behind, continue as soon as Tk has handled pending events.
+            # Otherwise new updates arrive through the wakeup event; the slow poll is only a fallback.
+            if len(updates) >= UPDATE_QUEUE_BATCH_LIMIT:
+                self._update_queue_poll_id = self.root.after_idle(self.check_update_queue)
+            else:
+                self._update_queue_poll_id = self.root.after(UPDATE_QUEUE_FALLBACK_POLL_MS, self.check_update_queue)
 
     def _handle_file_accepted_update(self, update):
         # Loading any new ebook counts as starting over for the current book.
@@ -2452,11 +2908,11 @@ class RadioShowApp(tk.Frame):
         self.state.voice_assignments = {}
         self.state.generated_clips_info = []
         self.state.speaker_colors = {}
-        self.state._color_palette_index = 0
         self.state.is_pass_2_completed = False
         self.state.stop_requested = False
 
         # Clear editor widget and its loaded-path tracker.
+        self._cancel_editor_text_load()
         self.editor_view.text_editor.delete('1.0', tk.END)
         self._editor_loaded_txt_path = None
 
@@ -2572,14 +3028,15 @@ class RadioShowApp(tk.Frame):
             return
 
         # Existing single ebook processing logic
-        if not self.state.narrator_voice_info and any(item['speaker'] not in self.state.voice_assignments or item['speaker'].upper() in {"AMBIGUOUS", "UNKNOWN", "TIMED_OUT", "NARRATOR"} for item in self.state.analysis_result):
+        speaker_summary = self._summarize_script_speakers()
+        if not self.state.narrator_voice_info and speaker_summary['needs_narrator']:
             self.show_status_message("Narrator voice needed for unassigned/unresolved lines, but none set. Please set one.", "warning")
             return
-        if self.state.voicing_mode == VoicingMode.NARRATOR_AND_SPEAKER and not self.state.speaker_voice_info and any(item['speaker'].upper() not in {'NARRATOR', 'AMBIGUOUS', 'UNKNOWN', 'TIMED_OUT'} for item in self.state.analysis_result):
+        if self.state.voicing_mode == VoicingMode.NARRATOR_AND_SPEAKER and not self.state.speaker_voice_info and speaker_summary['has_dialogue_speaker']:
             self.show_status_message("Speaker voice needed for 'Narrator & Speaker' mode, but none set. Please set one.", "warning")
             return
 
-        if not self.confirm_proceed_to_tts(): return
+        if not self.confirm_proceed_to_tts(speaker_summary): return
 
         self.set_ui_state(tk.DISABLED, exclude=[self.voice_assignment_view.back_button])
         self.progressbar.config(mode='determinate', value=0); self.progressbar.pack(fill=tk.X, padx=5, pady=(0,5), expand=True) # type: ignore
@@ -2589,25 +3046,59 @@ class RadioShowApp(tk.Frame):
         self.logic._start_background_task(self.logic.run_audio_generation, op_name='generation')
 
     def populate_review_tree(self):
-        if not self.review_tree: return
-        if self.review_tree: self.review_tree.delete(*self.review_tree.get_children())
+        tree = self.review_tree
+        if not tree: return
+        tree.delete(*tree.get_children())
         all_rows = self._build_review_display_rows()
         visible_rows = self._filter_review_display_rows(all_rows)
         self._review_visible_rows = visible_rows
-        max_line_count = 1
-        for i, row in enumerate(visible_rows):
-            speaker_color_tag = self.get_speaker_color_tag(row['speaker'])
-            row_tags = (speaker_color_tag, 'evenrow' if i % 2 == 0 else 'oddrow')
-            line_num = row['original_index'] + 1
-            wrapped_line, line_count = self._wrap_tree_cell_text(self.review_tree, 'line_text', row.get('line_text', ''))
-            max_line_count = max(max_line_count, line_count)
-            unique_iid = f"{row['original_index']}_{row['chunk_index']}"
-            if self.review_tree:
-                self.review_tree.insert('', tk.END, iid=unique_iid, values=(line_num, row['speaker'], row.get('subline_type', 'Narration'), row['issue'], wrapped_line, row['audio_file'], row['status']), tags=row_tags)
-        self._set_treeview_rowheight(self.review_tree, max_line_count)
-        if self.review_tree: self.update_treeview_item_tags(self.review_tree)
+        theming.configure_treeview_tags(self, tree)
+        # Filled like the Step 4 table: the first screenfuls now, the rest in batches from the event
+        # loop so a full book's clips don't freeze the window. A newer populate cancels an unfinished fill.
+        self._review_fill_token += 1
+        self._review_max_line_count = 1
+        self._insert_review_rows(self._review_fill_token, visible_rows, 0, self._tree_wrap_chars(tree, 'line_text'), STEP4_INITIAL_ROWS)
         self._update_review_filter_summary()
 
+    def _clear_review_tree(self):
+        self._review_fill_token += 1 # Stop an unfinished fill from adding rows back
+        if self.review_tree: self.review_tree.delete(*self.review_tree.get_children())
+
+    def _insert_review_rows(self, token, rows, start, wrap_chars, batch_size=None):
+        tree = self.review_tree
+        if token != self._review_fill_token or not tree:
+            return
+        end = min(len(rows), start + (batch_size or STEP4_ROW_BATCH))
+        max_line_count = self._review_max_line_count
+        # Same shape as _insert_step4_rows: each speaker's tag tuples built once per batch and every
+        # row inserted with its final tags (no per-row tag pass afterwards)
+        wrap_cell = self._wrap_tree_cell_text
+        speaker_colors = self.state.speaker_colors
+        row_tags_by_speaker = {}
+        batch = []
+        append = batch.append
+        for i in range(start, end):
+            row = rows[i]
+            speaker = row['speaker']
+            tag_pair = row_tags_by_speaker.get(speaker)
+            if tag_pair is None:
+                speaker_color_tag = theming.speaker_tag_name(speaker) if speaker in speaker_colors else "default_tag"
+                tag_pair = row_tags_by_speaker[speaker] = ((speaker_color_tag, 'evenrow'), (speaker_color_tag, 'oddrow'))
+            wrapped_line, line_count = wrap_cell(tree, 'line_text', row.get('line_text', ''), wrap_chars)
+            if line_count > max_line_count: max_line_count = line_count
+            append((
+                f"{row['original_index']}_{row['chunk_index']}",
+                (row['original_index'] + 1, speaker, row.get('subline_type', 'Narration'), row['issue'], wrapped_line, row['audio_file'], row['status']),
+                tag_pair[i & 1],
+            ))
+        self._bulk_insert_tree_rows(tree, batch)
+
+        if max_line_count != self._review_max_line_count or start == 0:
+            self._review_max_line_count = max_line_count
+            self._set_treeview_rowheight(tree, max_line_count)
+        if end < len(rows):
+            self.root.after(1, lambda: self._insert_review_rows(token, rows, end, wrap_chars))
+
 
 
     def play_selected_audio_clip(self):
@@ -2643,10 +3134,33 @@ class RadioShowApp(tk.Frame):
     def confirm_back_to_editor(self):
         if messagebox.askyesno("Confirm Navigation", "Any analysis edits will be lost. Are you sure you want to go back?"): self.show_editor_view()
         
-    def confirm_proceed_to_tts(self):
-        unresolved_speakers = {'AMBIGUOUS', 'UNKNOWN', 'TIMED_OUT'}
-        unresolved_count = sum(1 for item in self.state.analysis_result if item['speaker'].upper() in unresolved_speakers)
-        unassigned_speakers = {item['speaker'] for item in self.state.analysis_result if item['speaker'] not in self.state.voice_assignments}
+    def _summarize_script_speakers(self):
+        """Collect what the pre-generation checks and confirmation need from one scan of the script."""
+        voice_assignments = self.state.voice_assignments
+        unresolved_count = 0
+        unassigned_speakers = set()
+        needs_narrator = False
+        has_dialogue_speaker = False
+        # Per unique speaker rather than per line
+        for speaker, line_count in self.state.speaker_line_counts().items():
+            speaker_upper = speaker.upper()
+            if speaker_upper in _UNRESOLVED_SPEAKERS:
+                unresolved_count += line_count
+            if speaker not in voice_assignments:
+                unassigned_speakers.add(speaker)
+                needs_narrator = True
+            elif speaker_upper in _NARRATOR_OR_UNRESOLVED:
+                needs_narrator = True
+            if speaker_upper not in _NARRATOR_OR_UNRESOLVED:
+                has_dialogue_speaker = True
+        return {'unresolved_count': unresolved_count, 'unassigned_speakers': unassigned_speakers,
+                'needs_narrator': needs_narrator, 'has_dialogue_speaker': has_dialogue_speaker}
+
+    def confirm_proceed_to_tts(self, speaker_summary=None):
+        if speaker_summary is None:
+            speaker_summary = self._summarize_script_speakers()
+        unresolved_count = speaker_summary['unresolved_count']
+        unassigned_speakers = speaker_summary['unassigned_speakers']
 
         message_parts = []
 
@@ -2751,12 +3265,11 @@ class RadioShowApp(tk.Frame):
         # Remember folder selected
         self._update_last_dir_for_path('ebook_folder', folder_path)
 
-        ebook_files = []
-        for ext in self.allowed_extensions:
-            ebook_files.extend(Path(folder_path).glob(f"*{ext}"))
+        # One directory scan, matching extensions case-insensitively (e.g. BOOK.EPUB)
+        ebook_files = sorted(p for p in Path(folder_path).iterdir() if p.suffix.lower() in self.allowed_extensions and p.is_file())
         
         if not ebook_files:
-            messagebox.showinfo("No Ebooks Found", f"No supported ebook files ({', '.join(self.allowed_extensions)}) found in the selected folder.")
+            messagebox.showinfo("No Ebooks Found", f"No supported ebook files ({', '.join(sorted(self.allowed_extensions))}) found in the selected folder.")
             return
 
         if len(ebook_files) > 1:
@@ -2774,6 +3287,10 @@ class RadioShowApp(tk.Frame):
         if not self.state.txt_path:
             self.show_status_message("Error: No text file path is set. Cannot save.", "error")
             return # return messagebox.showerror("Error", "No text file path is set.")
+        if self._editor_loading_txt_path is not None:
+            # Saving now would truncate the file to the part loaded so far
+            self.show_status_message("Please wait: the text is still loading into the editor.", "warning")
+            return
         try:
             with open(self.state.txt_path, 'w', encoding='utf-8') as f: f.write(self.editor_view.text_editor.get('1.0', tk.END))
             self.show_status_message("Changes have been saved successfully.", "success")
@@ -2837,7 +3354,7 @@ class RadioShowApp(tk.Frame):
     def confirm_back_to_voices_from_review(self):
         if messagebox.askyesno("Confirm Navigation", "Going back will discard current generated audio clips. You'll need to regenerate them. Are you sure?"):
             self.state.generated_clips_info = [] # Clear generated clips
-            if self.review_tree: self.review_tree.delete(*self.review_tree.get_children()) # Clear review tree
+            self._clear_review_tree()
             # Important: We must clear the stop request flag before navigating
             self.state.stop_requested = False
             self.show_voice_assignment_view()
@@ -2845,7 +3362,7 @@ class RadioShowApp(tk.Frame):
     def confirm_back_to_analysis_from_review(self):
         if messagebox.askyesno("Confirm Navigation", "Going back will discard current generated audio clips. You'll need to regenerate them. Are you sure?"):
             self.state.generated_clips_info = [] # Clear generated clips
-            if self.review_tree: self.review_tree.delete(*self.review_tree.get_children()) # Clear review tree
+            self._clear_review_tree()
             # Important: We must clear the stop request flag before navigating
             self.state.stop_requested = False
             self.show_cast_refinement_view()
@@ -2865,6 +3382,18 @@ class RadioShowApp(tk.Frame):
         self.confirm_back_to_analysis_from_review()  # Then handle the navigation
         
     def save_voice_config(self):
+        """Schedules a voices_config.json write; a burst of voice edits collapses into one write."""
+        if self._voice_config_save_after_id is None:
+            self._voice_config_save_after_id = self.root.after(VOICE_CONFIG_SAVE_DELAY_MS, self._flush_voice_config)
+
+    def _flush_pending_voice_config_save(self):
+        """Write out a debounced save now, before anything reloads voices_config.json or the app closes."""
+        if self._voice_config_save_after_id is not None:
+            self.root.after_cancel(self._voice_config_save_after_id)
+            self._flush_voice_config()
+
+    def _flush_voice_config(self):
+        self._voice_config_save_after_id = None
         config_path = self.state.output_dir / "voices_config.json"
         
         # Filter self.voices to only include user-added voices (those with actual file paths)
@@ -2888,51 +3417,82 @@ class RadioShowApp(tk.Frame):
             "speaker_voice_name": self.state.speaker_voice_info['name'] if self.state.speaker_voice_info else None
         }
         try:
-            with open(config_path, 'w', encoding='utf-8') as f:
-                json.dump(config_data, f, indent=4, ensure_ascii=False)
+            payload = _dump_json_bytes(config_data)
+            # Write a sibling temp file and swap it in, so a crash never leaves a truncated config
+            tmp_path = config_path.with_name(config_path.name + ".tmp")
+            tmp_path.write_bytes(payload)
+            os.replace(tmp_path, config_path)
             self.logic.logger.info(f"Voice configuration saved to {config_path}")
         except Exception as e:
             self.logic.logger.error(f"Error saving voice configuration: {e}")
 
-    def load_voice_config(self):
+    def _read_voice_config(self):
+        """Read and validate voices_config.json. Touches no UI state, so it is safe off the UI thread.
+
+        Returns (config_data, needs_resave); config_data is None when the file does not exist.
+        """
         config_path = self.state.output_dir / "voices_config.json"
-        if config_path.exists():
-            needs_resave = False
-            try:
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    config_data = json.load(f)
-                
-                loaded_voices = config_data.get("voices", [])
-                valid_voices = []
-                for voice in loaded_voices:
-                    if Path(voice.get('path', '')).exists():
-                        valid_voices.append(voice)
-                    else:
-                        self.logic.logger.warning(f"Pruning missing voice file from config: {voice.get('name')} at {voice.get('path')}")
-                        needs_resave = True
-                
-                self.state.voices = valid_voices
-                self.state.loaded_narrator_voice_name_from_config = config_data.get("narrator_voice_name")
-                self.state.loaded_speaker_voice_name_from_config = config_data.get("speaker_voice_name")
+        if not config_path.exists():
+            self.logic.logger.info(f"Voice configuration file not found at {config_path}. Starting with empty voice list.")
+            return None, False
+        config_data = _load_json_bytes(config_path.read_bytes())
+
+        needs_resave = False
+        valid_voices = []
+        for voice in config_data.get("voices", []):
+            if Path(voice.get('path', '')).exists():
+                valid_voices.append(voice)
+            else:
+                self.logic.logger.warning(f"Pruning missing voice file from config: {voice.get('name')} at {voice.get('path')}")
+                needs_resave = True
+        config_data["voices"] = valid_voices
+        return config_data, needs_resave
 
-                if self.state.loaded_narrator_voice_name_from_config:
-                    self.state.narrator_voice_info = next((v for v in self.state.voices if v['name'] == self.state.loaded_narrator_voice_name_from_config), None)
-                else:
-                    self.state.narrator_voice_info = None
+    def _apply_voice_config(self, config_data, needs_resave=False):
+        if config_data is None:
+            self.state.voices, self.state.narrator_voice_info, self.state.speaker_voice_info, self.state.loaded_narrator_voice_name_from_config, self.state.loaded_speaker_voice_name_from_config = [], None, None, None, None
+            return
 
-                if self.state.loaded_speaker_voice_name_from_config:
-                    self.state.speaker_voice_info = next((v for v in self.state.voices if v['name'] == self.state.loaded_speaker_voice_name_from_config), None)
-                else:
-                    self.state.speaker_voice_info = None
+        self.state.voices = config_data["voices"]
+        self.state.loaded_narrator_voice_name_from_config = config_data.get("narrator_voice_name")
+        self.state.loaded_speaker_voice_name_from_config = config_data.get("speaker_voice_name")
 
-                self.logic.logger.info(f"Voice configuration loaded. Found {len(self.state.voices)} valid voices. Saved narrator: {self.state.loaded_narrator_voice_name_from_config or 'None'}. Saved speaker: {self.state.loaded_speaker_voice_name_from_config or 'None'}.")
-                if needs_resave: self.save_voice_config() # Clean up the config file
-            except Exception as e:
-                self.logic.logger.error(f"Error loading voice configuration: {e}. Starting with empty voice list.")
-                self.state.voices, self.state.narrator_voice_info, self.state.speaker_voice_info, self.state.loaded_narrator_voice_name_from_config, self.state.loaded_speaker_voice_name_from_config = [], None, None, None, None
+        if self.state.loaded_narrator_voice_name_from_config:
+            self.state.narrator_voice_info = self.state.find_voice(self.state.loaded_narrator_voice_name_from_config)
         else:
-            self.logic.logger.info(f"Voice configuration file not found at {config_path}. Starting with empty voice list.")
-            self.state.voices, self.state.narrator_voice_info, self.state.speaker_voice_info, self.state.loaded_narrator_voice_name_from_config, self.state.loaded_speaker_voice_name_from_config = [], None, None, None, None
+            self.state.narrator_voice_info = None
+
+        if self.state.loaded_speaker_voice_name_from_config:
+            self.state.speaker_voice_info = self.state.find_voice(self.state.loaded_speaker_voice_name_from_config)
+        else:
+            self.state.speaker_voice_info = None
+
+        self.logic.logger.info(f"Voice configuration loaded. Found {len(self.state.voices)} valid voices. Saved narrator: {self.state.loaded_narrator_voice_name_from_config or 'None'}. Saved speaker: {self.state.loaded_speaker_voice_name_from_config or 'None'}.")
+        if needs_resave: self.save_voice_config() # Clean up the config file
+
+    def load_voice_config(self):
+        try:
+            config_data, needs_resave = self._read_voice_config()
+        except Exception as e:
+            self.logic.logger.error(f"Error loading voice configuration: {e}. Starting with empty voice list.")
+            config_data, needs_resave = None, False
+        self._apply_voice_config(config_data, needs_resave)
+
+    def _load_voice_config_worker(self):
+        try:
+            config_data, needs_resave = self._read_voice_config()
+        except Exception as e:
+            self.logic.logger.error(f"Error loading voice configuration: {e}. Starting with empty voice list.")
+            config_data, needs_resave = None, False
+        self.update_queue.put({'voices_loaded': (config_data, needs_resave)})
+
+    def _handle_voices_loaded_update(self, payload):
+        config_data, needs_resave = payload
+        self._apply_voice_config(config_data, needs_resave)
+        if self.logic.current_tts_engine_instance:
+            # The engine finished first; re-add its internal voices and resolve saved defaults again
+            self._merge_engine_voices()
+        self.update_voice_dropdown()
 
     def start_final_assembly_process(self):
         if not self.state.generated_clips_info:
@@ -2989,6 +3549,7 @@ class RadioShowApp(tk.Frame):
                         self.logic.logger.warning(f"Could not delete stale text file {txt_candidate}: {e}")
             
             # Re-initialize the state and logic
+            self._flush_pending_voice_config_save() # Persist the old state's voices before it is replaced
             self.state = AppState()
             self.voicing_mode_var.set(self.state.voicing_mode.value)
             self.logic = AppLogic(self, self.state, self.selected_tts_engine_name)
@@ -3000,10 +3561,10 @@ class RadioShowApp(tk.Frame):
             # Reset UI elements
             self.wizard_view.update_metadata_display(None, None, None)
             self.wizard_view.file_status_label.config(text="No file selected.")
+            self._cancel_editor_text_load()
             self.editor_view.text_editor.delete('1.0', tk.END)
             self._editor_loaded_txt_path = None
-            if self.review_tree:
-                self.review_tree.delete(*self.review_tree.get_children())
+            self._clear_review_tree()
             
             # Reset other UI components that might hold old state
             if self.refinement_cast_tree:
@@ -3031,8 +3592,7 @@ class RadioShowApp(tk.Frame):
                 pass
 
         try:
-            with open(project_path, 'w', encoding='utf-8') as f:
-                json.dump(self.state.to_dict(), f, indent=4, ensure_ascii=False)
+            Path(project_path).write_bytes(_dump_json_bytes(self.state.to_dict()))
             self.show_status_message(f"Project saved to {project_path}", "success")
         except Exception as e:
             self.show_status_message(f"Error saving project: {e}", "error")
@@ -3055,8 +3615,7 @@ class RadioShowApp(tk.Frame):
                 pass
 
         try:
-            with open(project_path, 'r', encoding='utf-8') as f:
-                project_data = json.load(f)
+            project_data = _load_json_bytes(Path(project_path).read_bytes())
             self.state.from_dict(project_data)
             self.voicing_mode_var.set(self.state.voicing_mode.value)
             if hasattr(self, 'editor_view') and hasattr(self.editor_view, 'single_quote_var'):
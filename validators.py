@@ -4,7 +4,7 @@ import re
 from typing import List, Tuple
 
 class InputValidator:
-    SUPPORTED_FORMATS = ['.epub', '.mobi', '.pdf', '.azw3']
+    SUPPORTED_FORMATS = frozenset({'.epub', '.mobi', '.pdf', '.azw3'})
     MAX_FILE_SIZE_MB = 500
     MIN_TEXT_LENGTH = 100
     
@@ -15,7 +15,7 @@ class InputValidator:
             return False, "File does not exist"
         
         if file_path.suffix.lower() not in InputValidator.SUPPORTED_FORMATS:
-            return False, f"Unsupported format. Use: {', '.join(InputValidator.SUPPORTED_FORMATS)}"
+            return False, f"Unsupported format. Use: {', '.join(sorted(InputValidator.SUPPORTED_FORMATS))}"
         
         size_mb = file_path.stat().st_size / (1024 * 1024)
         if size_mb > InputValidator.MAX_FILE_SIZE_MB:
@@ -41,7 +41,7 @@ class InputValidator:
         if not file_path.exists():
             return False, "Voice file does not exist"
         
-        if file_path.suffix.lower() not in ['.wav', '.mp3', '.flac']:
+        if file_path.suffix.lower() not in {'.wav', '.mp3', '.flac'}:
             return False, "Voice file must be .wav, .mp3, or .flac"
         
         size_mb = file_path.stat().st_size / (1024 * 1024)
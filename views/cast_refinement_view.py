@@ -108,6 +108,9 @@ class CastRefinementView(tk.Frame):
         self.vsb.pack(side='right', fill='y'); self.hsb.pack(side='bottom', fill='x')
         self.tree.pack(side=tk.LEFT, expand=True, fill='both')
         self.tree.bind('<Double-1>', self.app_controller.on_treeview_double_click)
+        # Scrolling moves the rows out from under an open speaker cell editor, so it closes it
+        for sequence in ('<MouseWheel>', '<Button-4>', '<Button-5>'):
+            self.tree.bind(sequence, self.app_controller.cancel_speaker_cell_edit, add='+')
         
         # --- Bottom Buttons ---
         self.back_button = tk.Button(self.bottom_frame, text="< Back to Editor", command=self.app_controller.confirm_back_to_editor)
@@ -1,6 +1,6 @@
 # views/editor_view.py
 import tkinter as tk
-from tkinter import scrolledtext
+from tkinter import ttk
 
 class EditorView(tk.Frame):
     def __init__(self, master, app_controller):
@@ -14,8 +14,14 @@ class EditorView(tk.Frame):
         self.info_label = tk.Label(self, text="Step 3: Review and Edit Text", font=("Helvetica", 14, "bold"))
         self.info_label.pack(pady=(0, 10))
 
-        self.text_editor = scrolledtext.ScrolledText(self, wrap=tk.WORD, font=("Arial", 10))
-        self.text_editor.pack(expand=True, fill=tk.BOTH, padx=5, pady=5)
+        # Plain Text + ttk.Scrollbar: the scrollbar follows the ttk style, so a theme switch only recolors the Text
+        self.editor_frame = tk.Frame(self)
+        self.editor_frame.pack(expand=True, fill=tk.BOTH, padx=5, pady=5)
+        self.text_editor = tk.Text(self.editor_frame, wrap=tk.WORD, font=("Arial", 10))
+        self.vsb = ttk.Scrollbar(self.editor_frame, orient="vertical", command=self.text_editor.yview)
+        self.text_editor.configure(yscrollcommand=self.vsb.set)
+        self.vsb.pack(side='right', fill='y')
+        self.text_editor.pack(side=tk.LEFT, expand=True, fill=tk.BOTH)
 
         self.button_frame = tk.Frame(self) # Frame for buttons below editor
         self.button_frame.pack(fill=tk.X, pady=5)
@@ -40,8 +46,7 @@ class EditorView(tk.Frame):
 
         self.app_controller._themed_tk_labels.append(self.info_label)
         self.app_controller._themed_tk_buttons.extend([self.save_button, self.back_button, self.analyze_button])
-        self.app_controller._themed_tk_frames.extend([self, self.button_frame, self.options_frame])
-        self.app_controller._themed_tk_checkbuttons = getattr(self.app_controller, '_themed_tk_checkbuttons', [])
+        self.app_controller._themed_tk_frames.extend([self, self.editor_frame, self.button_frame, self.options_frame])
         self.app_controller._themed_tk_checkbuttons.append(self.single_quote_checkbox)
 
     def _on_single_quote_toggled(self):